@@ -1,20 +1,26 @@
 """Configuration settings for KinoWeek scrapers.
 
-All URLs, selectors, and settings are centralized here for easy maintenance.
-Uses TypedDict for structured configuration and Final for immutable constants.
+Shared URLs and settings are centralized here for easy maintenance.
+Venue-specific URLs and selectors live on each source class.
+Uses Final for immutable constants.
 """
 
 from __future__ import annotations
 
-from typing import Final, TypedDict
+from typing import Final
 
 __all__ = [
     "ASTOR_API_URL",
-    "CONCERT_VENUES",
     "REQUEST_TIMEOUT_SECONDS",
+    "MAX_CONCURRENT_FETCHES",
+    "HTTP_CACHE_DIR_ENV",
+    "HTTP_CACHE_TTL_SECONDS",
     "USER_AGENT",
     "TELEGRAM_MESSAGE_MAX_LENGTH",
+    "TELEGRAM_MAX_ATTEMPTS",
+    "TELEGRAM_RETRY_BACKOFF_SECONDS",
     "GERMAN_MONTH_MAP",
+    "GERMAN_MONTH_LOOKUP",
 ]
 
 
@@ -26,70 +32,6 @@ ASTOR_API_URL: Final[str] = "https://backend.premiumkino.de/v1/de/hannover/progr
 """Astor Grand Cinema API endpoint for movie program data."""
 
 
-# =============================================================================
-# Concert Venue Configuration
-# =============================================================================
-
-
-class VenueSelectors(TypedDict, total=False):
-    """CSS selectors for extracting event data from venue pages."""
-
-    container: str
-    event: str
-    title: str
-    date: str
-    location: str
-    venue: str
-
-
-class VenueConfig(TypedDict):
-    """Configuration for a concert venue scraper."""
-
-    name: str
-    url: str
-    enabled: bool
-    selectors: VenueSelectors
-
-
-CONCERT_VENUES: Final[tuple[VenueConfig, ...]] = (
-    {
-        "name": "ZAG Arena",
-        "url": "https://www.zag-arena-hannover.de/veranstaltungen/",
-        "enabled": True,
-        "selectors": {
-            "container": ".wpem-event-listings",
-            "event": ".wpem-event-layout-wrapper",
-            "title": ".wpem-heading-text a",
-            "date": ".wpem-from-date",
-            "location": ".wpem-event-infomation",
-        },
-    },
-    {
-        "name": "Swiss Life Hall",
-        "url": "https://www.swisslife-hall.de/events/",
-        "enabled": True,
-        "selectors": {
-            "event": "a.hc-card-link-wrapper",
-            "title": "h4, h3",
-            "date": ".hc-date-info",
-            "venue": "Swiss Life Hall",
-        },
-    },
-    {
-        "name": "Capitol Hannover",
-        "url": "https://www.capitol-hannover.de/events/",
-        "enabled": True,
-        "selectors": {
-            "event": "a.hc-card-link-wrapper",
-            "title": "h4, h3",
-            "date": ".hc-date-info",
-            "venue": "Capitol Hannover",
-        },
-    },
-)
-"""Concert venue configurations with CSS selectors for scraping."""
-
-
 # =============================================================================
 # HTTP Client Settings
 # =============================================================================
@@ -97,6 +39,15 @@ CONCERT_VENUES: Final[tuple[VenueConfig, ...]] = (
 REQUEST_TIMEOUT_SECONDS: Final[float] = 30.0
 """HTTP request timeout in seconds."""
 
+MAX_CONCURRENT_FETCHES: Final[int] = 8
+"""Maximum number of sources fetched in parallel."""
+
+HTTP_CACHE_DIR_ENV: Final[str] = "KINOWEEK_HTTP_CACHE_DIR"
+"""Environment variable enabling the on-disk HTTP cache (requires hishel)."""
+
+HTTP_CACHE_TTL_SECONDS: Final[float] = 7 * 24 * 60 * 60
+"""Age after which cached responses are evicted from the on-disk cache."""
+
 USER_AGENT: Final[str] = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -112,6 +63,12 @@ USER_AGENT: Final[str] = (
 TELEGRAM_MESSAGE_MAX_LENGTH: Final[int] = 4096
 """Maximum message length allowed by Telegram API."""
 
+TELEGRAM_MAX_ATTEMPTS: Final[int] = 3
+"""Attempts per message on connection errors and 5xx responses."""
+
+TELEGRAM_RETRY_BACKOFF_SECONDS: Final[float] = 0.5
+"""Delay before the first retry; doubled for each further attempt."""
+
 
 # =============================================================================
 # German Month Name Mappings
@@ -147,3 +104,10 @@ GERMAN_MONTH_MAP: Final[dict[str, int]] = {
     "dec": 12,
 }
 """Mapping of German month names/abbreviations to month numbers."""
+
+GERMAN_MONTH_LOOKUP: Final[dict[str, int]] = {
+    variant: month
+    for name, month in GERMAN_MONTH_MAP.items()
+    for variant in (name, name.upper(), name.capitalize())
+}
+"""GERMAN_MONTH_MAP with lower, UPPER and Capitalized keys for lookups without .lower()."""
@@ -64,8 +64,8 @@ def export_movies_csv(
             writer.writerow({
                 "week": week_num,
                 "title": event.title,
-                "date": event.date.strftime("%Y-%m-%d"),
-                "time": event.date.strftime("%H:%M"),
+                "date": event.date.date().isoformat(),
+                "time": f"{event.date.hour:02d}:{event.date.minute:02d}",
                 "duration_min": event.metadata.get("duration", 0),
                 "rating": event.metadata.get("rating", 0),
                 "year": event.metadata.get("year", 0),
@@ -175,7 +175,7 @@ def export_concerts_csv(
             writer.writerow({
                 "week": week_num,
                 "artist": event.title,
-                "date": event.date.strftime("%Y-%m-%d"),
+                "date": event.date.date().isoformat(),
                 "time": event.metadata.get("time", "20:00"),
                 "venue": event.venue,
                 "event_type": event.metadata.get("event_type", "concert"),
@@ -13,8 +13,14 @@ from __future__ import annotations
 import json
 import logging
 from datetime import datetime
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+try:
+    import orjson
+except ImportError:  # optional: pip install kinoweek[speedups]
+    orjson = None  # type: ignore[assignment]
 
 # Re-export CSV functions for backward compatibility
 from kinoweek.csv_exporters import (
@@ -24,7 +30,7 @@ from kinoweek.csv_exporters import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
 
     from kinoweek.models import Event
     from kinoweek.output import GroupedMovie
@@ -39,6 +45,7 @@ __all__ = [
     "export_web_json",
     "export_markdown_digest",
     "archive_weekly_data",
+    "dump_json",
 ]
 
 logger = logging.getLogger(__name__)
@@ -49,6 +56,23 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
+def dump_json(data: object) -> str:
+    """Serialize data as indented JSON text, keeping non-ASCII characters.
+
+    Uses orjson when installed (several times faster), otherwise the
+    standard library; both produce the same 2-space indented output.
+
+    Args:
+        data: JSON-serializable data (dicts, lists, strings, numbers).
+
+    Returns:
+        JSON text.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
 def _format_duration(minutes: int) -> str:
     """Format duration in minutes to human-readable string."""
     if minutes <= 0:
@@ -148,7 +172,7 @@ def export_enhanced_json(
     }
 
     json_path.write_text(
-        json.dumps(data, indent=2, ensure_ascii=False),
+        dump_json(data),
         encoding="utf-8",
     )
 
@@ -164,6 +188,10 @@ _DAY_ABBREVS = ["MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN"]
 _GERMAN_DAYS = ["Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"]
 _GERMAN_MONTHS = ["", "Jan", "Feb", "Mär", "Apr", "Mai", "Jun", "Jul", "Aug", "Sep", "Okt", "Nov", "Dez"]
 
+# Sort keys (C-level getters instead of a lambda per element)
+_BY_DATE = attrgetter("date")
+_BY_TIME: Callable[[dict[str, Any]], str] = itemgetter("time")
+
 
 def export_web_json(
     movies: Sequence[Event],
@@ -189,9 +217,9 @@ def export_web_json(
     json_path = output_path / "web_events.json"
 
     # Group movies by date
-    movies_by_date: dict[str, list[dict]] = {}
+    movies_by_date: dict[str, list[dict[str, Any]]] = {}
     for event in movies:
-        date_key = event.date.strftime("%Y-%m-%d")
+        date_key = event.date.date().isoformat()
         if date_key not in movies_by_date:
             movies_by_date[date_key] = []
 
@@ -218,7 +246,7 @@ def export_web_json(
         movies_by_date[date_key].append({
             "title": event.title,
             "year": event.metadata.get("year"),
-            "time": event.date.strftime("%H:%M"),
+            "time": f"{event.date.hour:02d}:{event.date.minute:02d}",
             "duration": _format_duration(int(event.metadata.get("duration", 0))),
             "language": lang_parts[0] if lang_parts else None,
             "subtitles": "DE" if len(lang_parts) == 2 else None,
@@ -228,18 +256,18 @@ def export_web_json(
         })
 
     # Convert to frontend format (sorted by date)
-    movies_list = []
+    movies_list: list[dict[str, Any]] = []
     for date_key in sorted(movies_by_date.keys()):
         dt = datetime.fromisoformat(date_key)
         movies_list.append({
             "day": _DAY_ABBREVS[dt.weekday()],
-            "date": dt.strftime("%d.%m"),
-            "movies": sorted(movies_by_date[date_key], key=lambda m: m["time"]),
+            "date": f"{dt.day:02d}.{dt.month:02d}",
+            "movies": sorted(movies_by_date[date_key], key=_BY_TIME),
         })
 
     # Format concerts
     concerts_list = []
-    for event in sorted(concerts, key=lambda e: e.date):
+    for event in sorted(concerts, key=_BY_DATE):
         dt = event.date
         day_name = _GERMAN_DAYS[dt.weekday()]
         month_name = _GERMAN_MONTHS[dt.month]
@@ -281,7 +309,7 @@ def export_web_json(
     }
 
     json_path.write_text(
-        json.dumps(data, indent=2, ensure_ascii=False),
+        dump_json(data),
         encoding="utf-8",
     )
 
@@ -378,7 +406,7 @@ def export_markdown_digest(
     ])
 
     for event in concerts:
-        date_str = event.date.strftime("%Y-%m-%d")
+        date_str = event.date.date().isoformat()
         time_str = event.metadata.get("time", "20:00")
         status = event.metadata.get("status", "available")
         status_display = "Available" if status == "available" else "Sold Out"
@@ -452,7 +480,7 @@ def archive_weekly_data(
     }
 
     archive_path.write_text(
-        json.dumps(data, indent=2, ensure_ascii=False),
+        dump_json(data),
         encoding="utf-8",
     )
 
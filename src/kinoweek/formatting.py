@@ -5,7 +5,8 @@ Contains language abbreviations, date formatting, and message section builders.
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -81,9 +82,12 @@ GERMAN_MONTHS: dict[int, str] = {
 # =============================================================================
 
 
+@lru_cache(maxsize=64)
 def abbreviate_language(language: str) -> str:
     """Convert language string to compact abbreviation.
 
+    Memoized: a week has only a few distinct labels but one per showtime.
+
     Args:
         language: Full language string (e.g., "Sprache: Englisch").
 
@@ -149,11 +153,12 @@ def format_movie_metadata(event: Event) -> list[str]:
     return parts
 
 
-def format_concert_date(event: Event) -> str:
+def format_concert_date(event: Event, current_year: int | None = None) -> str:
     """Format concert date in a nice, expanded format.
 
     Args:
         event: Concert event.
+        current_year: Year shown without a suffix (defaults to this year).
 
     Returns:
         Formatted date like "Sa, 29. Nov" or "Fr, 13. Jan 2026".
@@ -163,7 +168,9 @@ def format_concert_date(event: Event) -> str:
     month_name = GERMAN_MONTHS.get(dt.month, "")
 
     # Include year if not current year
-    if dt.year != datetime.now().year:
+    if current_year is None:
+        current_year = datetime.now().year
+    if dt.year != current_year:
         return f"{day_name}, {dt.day}. {month_name} {dt.year}"
     return f"{day_name}, {dt.day}. {month_name}"
 
@@ -198,7 +205,7 @@ def _format_movie_entry(event: Event) -> list[str]:
         lines.append(f"  _{' | '.join(meta_parts)}_")
 
     # Time and language
-    time_str = event.date.strftime("%H:%M")
+    time_str = f"{event.date.hour:02d}:{event.date.minute:02d}"
     language = event.metadata.get("language", "")
     lang_display = abbreviate_language(language)
     lines.append(f"  {time_str} ({lang_display})")
@@ -206,11 +213,12 @@ def _format_movie_entry(event: Event) -> list[str]:
     return lines
 
 
-def _format_concert_entry(event: Event) -> list[str]:
+def _format_concert_entry(event: Event, current_year: int) -> list[str]:
     """Format a single concert entry with expanded date.
 
     Args:
         event: Concert event to format.
+        current_year: Year shown without a suffix.
 
     Returns:
         List of lines for this concert entry.
@@ -221,7 +229,7 @@ def _format_concert_entry(event: Event) -> list[str]:
     lines.append(f"  *{event.title}*")
 
     # Date and venue on same line
-    date_str = format_concert_date(event)
+    date_str = format_concert_date(event, current_year)
     venue_short = abbreviate_venue(event.venue)
     time_str = event.metadata.get("time", "20:00")
 
@@ -230,11 +238,16 @@ def _format_concert_entry(event: Event) -> list[str]:
     return lines
 
 
-def format_movies_section(movies: Sequence[Event]) -> str:
+def format_movies_section(
+    movies: Sequence[Event], max_length: int | None = None
+) -> str:
     """Format the movies section of the message.
 
     Args:
         movies: List of movie events.
+        max_length: Stop adding entries once the section is longer than
+            this; callers that truncate the message anyway pass their
+            remaining budget to skip formatting text that would be cut.
 
     Returns:
         Formatted movies section.
@@ -245,27 +258,36 @@ def format_movies_section(movies: Sequence[Event]) -> str:
         lines.append("_No OV movies this week_")
         return "\n".join(lines)
 
-    # Group by date for better readability
-    movies_by_date: dict[str, list[Event]] = {}
+    # Group by calendar day for better readability; the heading is
+    # formatted once per day rather than once per showtime
+    movies_by_date: dict[date, list[Event]] = {}
     for event in movies:
-        date_key = event.format_date_short()
-        if date_key not in movies_by_date:
-            movies_by_date[date_key] = []
-        movies_by_date[date_key].append(event)
+        movies_by_date.setdefault(event.date.date(), []).append(event)
 
-    for date_str, date_events in movies_by_date.items():
-        lines.append(f"\n*{date_str}*")
+    length = len(lines[0])
+    for date_events in movies_by_date.values():
+        lines.append(f"\n*{date_events[0].format_date_short()}*")
+        length += len(lines[-1]) + 1
         for event in date_events:
-            lines.extend(_format_movie_entry(event))
+            entry = _format_movie_entry(event)
+            lines.extend(entry)
+            if max_length is not None:
+                length += sum(map(len, entry)) + len(entry)
+                if length > max_length:
+                    return "\n".join(lines)
 
     return "\n".join(lines)
 
 
-def format_radar_section(radar: Sequence[Event]) -> str:
+def format_radar_section(
+    radar: Sequence[Event], max_length: int | None = None
+) -> str:
     """Format the radar (concerts/big events) section of the message.
 
     Args:
         radar: List of upcoming big events.
+        max_length: Stop adding entries once the section is longer than
+            this (see `format_movies_section`).
 
     Returns:
         Formatted radar section.
@@ -276,7 +298,15 @@ def format_radar_section(radar: Sequence[Event]) -> str:
         lines.append("_No upcoming events_")
         return "\n".join(lines)
 
+    # Read the clock once for the whole section, not once per entry
+    current_year = datetime.now().year
+    length = len(lines[0])
     for event in radar:
-        lines.extend(_format_concert_entry(event))
+        entry = _format_concert_entry(event, current_year)
+        lines.extend(entry)
+        if max_length is not None:
+            length += sum(map(len, entry)) + len(entry)
+            if length > max_length:
+                break
 
     return "\n".join(lines)
@@ -10,10 +10,12 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
 import sys
 from typing import NoReturn
 
 from kinoweek.aggregator import fetch_all_events
+from kinoweek.config import HTTP_CACHE_DIR_ENV
 from kinoweek.notifier import notify
 
 __all__ = ["main", "run"]
@@ -158,6 +160,11 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Save results locally instead of sending to Telegram",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Bypass the on-disk HTTP cache even if {HTTP_CACHE_DIR_ENV} is set",
+    )
     return parser.parse_args()
 
 
@@ -180,6 +187,9 @@ def main() -> NoReturn:
     _configure_logging()
     args = _parse_args()
     _load_environment()
+    if args.no_cache:
+        # After .env loading, which may set it; the HTTP client reads it lazily
+        os.environ.pop(HTTP_CACHE_DIR_ENV, None)
 
     success = run(local_only=args.local)
     sys.exit(0 if success else 1)
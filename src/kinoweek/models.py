@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Final, Literal
 
 if TYPE_CHECKING:
     from typing import Self
@@ -19,6 +19,25 @@ __all__ = ["Event", "EventCategory", "EventMetadata"]
 EventCategory = Literal["movie", "culture", "radar"]
 EventMetadata = dict[str, str | int | list[str]]
 
+# English abbreviations as produced by strftime's %a/%b in the default C locale;
+# formatting with f-strings skips strftime's format-string parsing
+_WEEKDAY_ABBRS: Final = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTH_ABBRS: Final = (
+    "",  # months are 1-based
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
 
 @dataclass(slots=True, kw_only=True)
 class Event:
@@ -59,7 +78,8 @@ class Event:
         Returns:
             Formatted date string with weekday abbreviation.
         """
-        return self.date.strftime("%a %d.%m.")
+        dt = self.date
+        return f"{_WEEKDAY_ABBRS[dt.weekday()]} {dt.day:02d}.{dt.month:02d}."
 
     def format_date_long(self) -> str:
         """Format date with month name and optional year.
@@ -69,10 +89,10 @@ class Event:
         Returns:
             Formatted date like '12. Dec' or '15. Mar 2026'.
         """
-        today = datetime.now()
-        if self.date.year != today.year:
-            return self.date.strftime("%d. %b %Y")
-        return self.date.strftime("%d. %b")
+        dt = self.date
+        if dt.year != datetime.now().year:
+            return f"{dt.day:02d}. {_MONTH_ABBRS[dt.month]} {dt.year}"
+        return f"{dt.day:02d}. {_MONTH_ABBRS[dt.month]}"
 
     def format_time(self) -> str:
         """Format as weekday and time (e.g., 'Fri 19:30').
@@ -80,7 +100,8 @@ class Event:
         Returns:
             Formatted time string with weekday abbreviation.
         """
-        return self.date.strftime("%a %H:%M")
+        dt = self.date
+        return f"{_WEEKDAY_ABBRS[dt.weekday()]} {dt.hour:02d}:{dt.minute:02d}"
 
     def is_this_week(self) -> bool:
         """Check if event occurs within the next 7 days.
@@ -10,22 +10,36 @@ from __future__ import annotations
 import json
 import logging
 import os
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, TypedDict
 
 import httpx
 
-from kinoweek.config import TELEGRAM_MESSAGE_MAX_LENGTH
+try:
+    import orjson
+except ImportError:  # optional: pip install kinoweek[speedups]
+    orjson = None  # type: ignore[assignment]
+
+from kinoweek.config import (
+    TELEGRAM_MAX_ATTEMPTS,
+    TELEGRAM_MESSAGE_MAX_LENGTH,
+    TELEGRAM_RETRY_BACKOFF_SECONDS,
+)
+from kinoweek.exporters import dump_json
 from kinoweek.formatting import format_movies_section, format_radar_section
 from kinoweek.models import Event
 from kinoweek.output import export_all_formats
+from kinoweek.sources.base import get_http_client
 
 if TYPE_CHECKING:
     pass
 
 __all__ = [
     "format_message",
+    "format_message_chunks",
+    "split_message",
     "send_telegram_message",
     "save_to_file",
     "save_all_formats",
@@ -52,17 +66,16 @@ class EventsData(TypedDict):
 # =============================================================================
 
 
-def format_message(events_data: EventsData) -> str:
-    """Format events into a Telegram-ready message.
-
-    Creates a two-section message with movies and upcoming concerts,
-    formatted with Telegram Markdown.
+def _build_message(events_data: EventsData, max_length: int | None = None) -> str:
+    """Build the full message text without enforcing Telegram limits.
 
     Args:
         events_data: Dictionary with categorized event lists.
+        max_length: Length past which sections stop adding entries, for
+            callers that truncate the result anyway. None formats everything.
 
     Returns:
-        Formatted message string ready for Telegram.
+        Formatted message string.
     """
     movies = events_data.get("movies_this_week", [])
     radar = events_data.get("big_events_radar", [])
@@ -70,14 +83,96 @@ def format_message(events_data: EventsData) -> str:
     week_num = datetime.now().isocalendar()[1]
     lines: list[str] = [f"*Hannover Week {week_num}*\n"]
 
+    # Sections stop formatting entries once they are past what the caller
+    # keeps, so oversized weeks do not format text that is cut
+    budget = None if max_length is None else max_length - len(lines[0]) - 1
+
     # Section 1: Movies
-    lines.append(format_movies_section(movies))
+    movies_section = format_movies_section(movies, max_length=budget)
+    lines.append(movies_section)
     lines.append("")
+    if budget is not None:
+        budget = max(budget - len(movies_section) - 2, 0)
 
     # Section 2: Radar (Concerts)
-    lines.append(format_radar_section(radar))
+    lines.append(format_radar_section(radar, max_length=budget))
+
+    return "\n".join(lines).strip()
+
+
+def split_message(
+    message: str, max_length: int = TELEGRAM_MESSAGE_MAX_LENGTH
+) -> list[str]:
+    """Split a message into chunks that each fit in one Telegram message.
+
+    Chunks are cut at line boundaries so Markdown entities, which never
+    span lines in our format, stay balanced. A single line longer than
+    max_length is hard-cut.
+
+    Args:
+        message: Message text to split.
+        max_length: Maximum length of each chunk.
+
+    Returns:
+        Non-empty list of chunks, in order.
+    """
+    if len(message) <= max_length:
+        return [message]
+
+    chunks: list[str] = []
+    current: list[str] = []
+    length = 0
+    for line in message.split("\n"):
+        # Hard-cut overlong lines; only the last piece joins the next chunk
+        rest = line
+        while len(rest) > max_length:
+            if current:
+                chunks.append("\n".join(current))
+                current, length = [], 0
+            chunks.append(rest[:max_length])
+            rest = rest[max_length:]
+        # Joining adds one newline per line after the first
+        added = len(rest) + (1 if current else 0)
+        if current and length + added > max_length:
+            chunks.append("\n".join(current))
+            current, length, added = [], 0, len(rest)
+        current.append(rest)
+        length += added
+    if current:
+        chunks.append("\n".join(current))
+
+    # Blank lines at a cut would otherwise start or end a message
+    return [chunk.strip("\n") for chunk in chunks if chunk.strip()]
+
+
+def format_message_chunks(events_data: EventsData) -> list[str]:
+    """Format events into one or more Telegram-sized messages.
+
+    Unlike `format_message`, nothing is truncated: weeks that do not fit
+    in one message are split across several.
+
+    Args:
+        events_data: Dictionary with categorized event lists.
+
+    Returns:
+        List of message strings, each within Telegram limits.
+    """
+    return split_message(_build_message(events_data))
 
-    message = "\n".join(lines).strip()
+
+def format_message(events_data: EventsData) -> str:
+    """Format events into a Telegram-ready message.
+
+    Creates a two-section message with movies and upcoming concerts,
+    formatted with Telegram Markdown.
+
+    Args:
+        events_data: Dictionary with categorized event lists.
+
+    Returns:
+        Formatted message string ready for Telegram.
+    """
+    message = _build_message(events_data, TELEGRAM_MESSAGE_MAX_LENGTH)
 
     # Ensure message doesn't exceed Telegram limits
     if len(message) > TELEGRAM_MESSAGE_MAX_LENGTH:
@@ -92,13 +187,19 @@ def format_message(events_data: EventsData) -> str:
 # =============================================================================
 
 
-def send_telegram_message(message: str) -> bool:
+def send_telegram_message(
+    message: str, *, client: httpx.Client | None = None
+) -> bool:
     """Send message via Telegram Bot API.
 
     Requires TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID environment variables.
+    Connection errors and 5xx responses are retried with exponential
+    backoff, up to TELEGRAM_MAX_ATTEMPTS attempts.
 
     Args:
         message: Message text to send.
+        client: HTTP client to send with. Defaults to the shared pooled
+            client, so the connection opened while scraping can be reused.
 
     Returns:
         True if message was sent successfully.
@@ -119,24 +220,47 @@ def send_telegram_message(message: str) -> bool:
         "text": message,
         "parse_mode": "Markdown",
     }
+    # Serialized once (with orjson when installed) and reused on retries
+    body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode()
+    headers = {"Content-Type": "application/json"}
+
+    if client is None:
+        client = get_http_client()
+
+    for attempt in range(1, TELEGRAM_MAX_ATTEMPTS + 1):
+        if attempt > 1:
+            time.sleep(TELEGRAM_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 2))
+        can_retry = attempt < TELEGRAM_MAX_ATTEMPTS
+
+        try:
+            response = client.post(url, content=body, headers=headers)
+        except httpx.TransportError as exc:
+            if can_retry:
+                logger.warning("Telegram request failed, retrying: %s", exc)
+                continue
+            logger.exception("Failed to send Telegram message: %s", exc)
+            return False
+        except httpx.RequestError as exc:
+            logger.exception("Failed to send Telegram message: %s", exc)
+            return False
 
-    try:
-        with httpx.Client(timeout=30) as client:
-            response = client.post(url, json=payload)
-            response.raise_for_status()
-
-            result = response.json()
-            if result.get("ok"):
-                logger.info("Telegram message sent successfully")
-                return True
+        if response.is_server_error and can_retry:
+            logger.warning(
+                "Telegram returned HTTP %d, retrying", response.status_code
+            )
+            continue
+        response.raise_for_status()
 
-            logger.error("Telegram API error: %s", result)
-            return False
+        result = response.json()
+        if result.get("ok"):
+            logger.info("Telegram message sent successfully")
+            return True
 
-    except httpx.RequestError as exc:
-        logger.exception("Failed to send Telegram message: %s", exc)
+        logger.error("Telegram API error: %s", result)
         return False
 
+    return False
+
 
 # Backward compatibility alias
 send_telegram = send_telegram_message
@@ -170,6 +294,8 @@ def save_to_file(
     message: str,
     events_data: EventsData,
     output_dir: str | Path = "output",
+    *,
+    include_json: bool = True,
 ) -> None:
     """Save message and event data to local files.
 
@@ -181,6 +307,8 @@ def save_to_file(
         message: Formatted message string.
         events_data: Dictionary of event lists.
         output_dir: Output directory path.
+        include_json: Write events.json. Pass False when `save_all_formats`
+            follows into the same directory, since it overwrites the file.
     """
     output_path = Path(output_dir)
 
@@ -192,22 +320,23 @@ def save_to_file(
         message_file.write_text(message, encoding="utf-8")
 
         # Save structured event data
-        json_data = {
-            "movies_this_week": [
-                _event_to_dict(e)
-                for e in events_data.get("movies_this_week", [])
-            ],
-            "big_events_radar": [
-                _event_to_dict(e)
-                for e in events_data.get("big_events_radar", [])
-            ],
-        }
-
-        json_file = output_path / "events.json"
-        json_file.write_text(
-            json.dumps(json_data, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        if include_json:
+            json_data = {
+                "movies_this_week": [
+                    _event_to_dict(e)
+                    for e in events_data.get("movies_this_week", [])
+                ],
+                "big_events_radar": [
+                    _event_to_dict(e)
+                    for e in events_data.get("big_events_radar", [])
+                ],
+            }
+
+            json_file = output_path / "events.json"
+            json_file.write_text(
+                dump_json(json_data),
+                encoding="utf-8",
+            )
 
         logger.info("Results saved to %s/", output_path)
 
@@ -250,7 +379,8 @@ def save_all_formats(
 def notify(events_data: EventsData, *, local_only: bool = False) -> bool:
     """Send notification or save locally based on mode.
 
-    In production mode (local_only=False), sends to Telegram and
+    In production mode (local_only=False), sends to Telegram, split
+    across several messages if the week does not fit in one, and
     creates a backup. In development mode (local_only=True), saves
     to local files and prints to console.
 
@@ -262,16 +392,22 @@ def notify(events_data: EventsData, *, local_only: bool = False) -> bool:
         True if notification was successful.
     """
     try:
-        message = format_message(events_data)
-
         if local_only:
-            # Save Telegram message format
-            save_to_file(message, events_data)
+            message = format_message(events_data)
+
+            # Save Telegram message format (events.json comes from the
+            # full export below, so it is not serialized twice)
+            save_to_file(message, events_data, include_json=False)
 
             # Also export all enhanced formats (CSV, Markdown, Archive)
             output_paths = save_all_formats(events_data)
             logger.info("Results saved locally (development mode)")
-            logger.info("Output files: %s", ", ".join(str(p) for p in output_paths.values()))
+            if logger.isEnabledFor(logging.INFO):
+                # The file list is only joined when the record will be emitted
+                logger.info(
+                    "Output files: %s",
+                    ", ".join(str(p) for p in output_paths.values()),
+                )
 
             print(f"\n{message}\n")
             print("\nAdditional outputs generated:")
@@ -280,13 +416,19 @@ def notify(events_data: EventsData, *, local_only: bool = False) -> bool:
 
             return True
 
-        success = send_telegram_message(message)
+        # Long weeks go out as several messages rather than being cut; they
+        # all reuse the shared client's keep-alive connection
+        chunks = format_message_chunks(events_data)
+        success = all(send_telegram_message(chunk) for chunk in chunks)
         if success:
+            message = "\n\n".join(chunks)
             # Create backup and full export when sending
-            save_to_file(message, events_data, "backup")
+            save_to_file(message, events_data, "backup", include_json=False)
             save_all_formats(events_data, "backup")
-        return success
 
     except Exception as exc:
         logger.exception("Notification failed: %s", exc)
         return False
+
+    else:
+        return success
@@ -21,6 +21,7 @@ from kinoweek.exporters import (
     export_movies_grouped_csv,
     export_web_json,
 )
+from kinoweek.formatting import abbreviate_language
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -87,11 +88,12 @@ def group_movies_by_film(movies: Sequence[Event]) -> list[GroupedMovie]:
     Returns:
         List of GroupedMovie objects with consolidated showtimes.
     """
-    films: dict[str, GroupedMovie] = {}
+    films: dict[tuple[str, object], GroupedMovie] = {}
 
     for event in movies:
-        # Create unique key based on title and year
-        key = f"{event.title}_{event.metadata.get('year', 0)}"
+        # One GroupedMovie per film (title and year); its metadata is built
+        # from the first showtime and shared by the rest
+        key = (event.title, event.metadata.get("year", 0))
 
         if key not in films:
             films[key] = GroupedMovie(
@@ -114,25 +116,11 @@ def group_movies_by_film(movies: Sequence[Event]) -> list[GroupedMovie]:
         language = str(event.metadata.get("language", ""))
         has_subtitles = "Untertitel:" in language
 
-        # Abbreviate language
-        lang_short = language
-        for full, abbrev in [
-            ("Sprache: ", ""),
-            ("Untertitel: ", "UT:"),
-            ("Englisch", "EN"),
-            ("Japanisch", "JP"),
-            ("Deutsch", "DE"),
-            ("Französisch", "FR"),
-            ("Italienisch", "IT"),
-            ("Spanisch", "ES"),
-        ]:
-            lang_short = lang_short.replace(full, abbrev)
-
         films[key].showtimes.append(
             Showtime(
-                date=event.date.strftime("%Y-%m-%d"),
-                time=event.date.strftime("%H:%M"),
-                language=lang_short,
+                date=event.date.date().isoformat(),
+                time=f"{event.date.hour:02d}:{event.date.minute:02d}",
+                language=abbreviate_language(language),
                 has_subtitles=has_subtitles,
             )
         )
@@ -24,6 +24,7 @@ from __future__ import annotations
 import importlib
 import logging
 import pkgutil
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -50,11 +51,27 @@ __all__ = [
 logger = logging.getLogger(__name__)
 
 
-def discover_sources() -> int:
+def discover_sources(*, force: bool = False) -> int:
     """Auto-import all source modules to trigger registration.
 
-    Scans subdirectories (cinema, concerts, theaters, etc.) and imports
-    all Python modules found, which triggers the @register_source decorator.
+    Scans the source subpackages (cinema, concerts, ...) and imports all
+    Python modules found, which triggers the @register_source decorator.
+    The scan runs once; later calls return the cached count.
+
+    Args:
+        force: Re-scan even if discovery has already run.
+
+    Returns:
+        Number of source modules discovered.
+    """
+    if force:
+        _discover.cache_clear()
+    return _discover()
+
+
+@cache
+def _discover() -> int:
+    """Run one discovery pass; cached so it happens once per process.
 
     Returns:
         Number of source modules discovered.
@@ -62,20 +79,20 @@ def discover_sources() -> int:
     package_dir = Path(__file__).parent
     discovered = 0
 
-    # Define subdirectories to scan for sources
-    source_types = ["cinema", "concerts", "theaters", "festivals", "museums"]
-
-    for subdir in source_types:
-        subdir_path = package_dir / subdir
-        if not subdir_path.exists():
+    # Only existing subpackages are listed, so no per-type directory probing
+    for package_info in pkgutil.iter_modules(__path__):
+        if not package_info.ispkg or package_info.name.startswith("_"):
             continue
 
+        package_name = f"{__name__}.{package_info.name}"
+        subdir_path = package_dir / package_info.name
+
         # Import all modules in the subdirectory
         for module_info in pkgutil.iter_modules([str(subdir_path)]):
             if module_info.name.startswith("_"):
                 continue  # Skip private modules
 
-            module_name = f"kinoweek.sources.{subdir}.{module_info.name}"
+            module_name = f"{package_name}.{module_info.name}"
             try:
                 importlib.import_module(module_name)
                 discovered += 1
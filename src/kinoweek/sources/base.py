@@ -17,21 +17,41 @@ Example:
 
 from __future__ import annotations
 
+import atexit
+import json
 import logging
+import os
 import re
+import threading
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import TYPE_CHECKING, Callable, ClassVar, Final, TypeVar
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Final, TypeVar, cast
 
 import httpx
+import lxml.html
+from lxml import etree
+
+try:
+    import orjson
+except ImportError:  # optional: pip install kinoweek[speedups]
+    orjson = None  # type: ignore[assignment]
 
 from kinoweek.config import (
+    GERMAN_MONTH_LOOKUP,
     GERMAN_MONTH_MAP,
+    HTTP_CACHE_DIR_ENV,
+    HTTP_CACHE_TTL_SECONDS,
+    MAX_CONCURRENT_FETCHES,
     REQUEST_TIMEOUT_SECONDS,
     USER_AGENT,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from lxml.html import HtmlElement
+
     from kinoweek.models import Event
 
 __all__ = [
@@ -41,6 +61,15 @@ __all__ = [
     "get_all_sources",
     "get_sources_by_type",
     "create_http_client",
+    "get_http_client",
+    "close_http_client",
+    "load_json",
+    "parse_html",
+    "iterparse_html",
+    "has_class",
+    "select_first",
+    "element_text",
+    "parse_german_month",
     "parse_german_date",
     "parse_venue_date",
     "is_original_version",
@@ -48,6 +77,34 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+
+def _build_venue_date_pattern() -> re.Pattern[str]:
+    """Build the venue date regex with one capture group per month.
+
+    Groups 2-13 correspond to months 1-12, so the matched month index is
+    resolved by the regex engine instead of a lowercase + dict lookup.
+    """
+    names_by_month: dict[int, list[str]] = {}
+    for name, month in GERMAN_MONTH_MAP.items():
+        names_by_month.setdefault(month, []).append(name)
+
+    month_groups = "|".join(
+        f"({'|'.join(sorted(names_by_month[month], key=len, reverse=True))})"
+        for month in range(1, 13)
+    )
+    return re.compile(rf"(\d{{1,2}})(?:{month_groups})(\d{{4}})", re.IGNORECASE)
+
+
+# German date (e.g., "22.11.2025") and clock time (e.g., "19:30").
+# ASCII-only: \d must not match other Unicode digits that int() would accept.
+_GERMAN_DATE_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"(\d{1,2})\.(\d{1,2})\.(\d{4})", re.ASCII
+)
+_TIME_PATTERN: Final[re.Pattern[str]] = re.compile(r"(\d{1,2}):(\d{2})", re.ASCII)
+
+# Day + month name + year (e.g., "22NOV2025"); groups: day, m01..m12, year
+_VENUE_DATE_PATTERN: Final[re.Pattern[str]] = _build_venue_date_pattern()
+
 # =============================================================================
 # Source Registry
 # =============================================================================
@@ -153,6 +210,10 @@ class BaseSource(ABC):
         max_events: Optional limit on events to fetch.
     """
 
+    # Sources keep no instance state; subclasses also declare empty slots so
+    # instances carry no per-instance __dict__
+    __slots__ = ()
+
     # Subclasses must define these
     source_name: ClassVar[str]
     source_type: ClassVar[str]
@@ -180,18 +241,198 @@ class BaseSource(ABC):
 # Shared Helper Functions
 # =============================================================================
 
+# One pooled keep-alive connection per concurrently fetched source; idle
+# connections stay open long enough to be reused by follow-up requests.
+_HTTP_LIMITS: Final[httpx.Limits] = httpx.Limits(
+    max_connections=4 * MAX_CONCURRENT_FETCHES,
+    max_keepalive_connections=MAX_CONCURRENT_FETCHES,
+    keepalive_expiry=30.0,
+)
+
 
 def create_http_client() -> httpx.Client:
     """Create a configured HTTP client with standard headers.
 
+    If KINOWEEK_HTTP_CACHE_DIR is set and hishel is installed, the client
+    caches responses on disk and revalidates them with conditional GETs
+    (ETag/Last-Modified), so unchanged pages are not downloaded again.
+
     Returns:
         Configured httpx.Client instance.
     """
-    return httpx.Client(
-        headers={"User-Agent": USER_AGENT},
-        timeout=REQUEST_TIMEOUT_SECONDS,
-        follow_redirects=True,
-    )
+    options: dict[str, Any] = {
+        "headers": {"User-Agent": USER_AGENT},
+        "timeout": REQUEST_TIMEOUT_SECONDS,
+        "limits": _HTTP_LIMITS,
+        "follow_redirects": True,
+        "http2": True,
+    }
+
+    cache_dir = os.getenv(HTTP_CACHE_DIR_ENV)
+    if cache_dir:
+        try:
+            from hishel import SyncSqliteStorage
+            from hishel.httpx import SyncCacheClient
+        except ImportError:
+            logger.debug("hishel not available, HTTP caching disabled")
+        else:
+            cache_path = Path(cache_dir)
+            cache_path.mkdir(parents=True, exist_ok=True)
+            # SyncCacheClient subclasses httpx.Client
+            return cast(
+                "httpx.Client",
+                SyncCacheClient(
+                    storage=SyncSqliteStorage(
+                        database_path=cache_path / "http.db",
+                        default_ttl=HTTP_CACHE_TTL_SECONDS,
+                    ),
+                    **options,
+                ),
+            )
+
+    return httpx.Client(**options)
+
+
+class _SharedClient:
+    """Holder for the process-wide client, mutated in place under its lock."""
+
+    __slots__ = ("client", "lock")
+
+    def __init__(self) -> None:
+        self.client: httpx.Client | None = None
+        self.lock = threading.Lock()
+
+
+_shared_http = _SharedClient()
+
+
+def get_http_client() -> httpx.Client:
+    """Get the process-wide shared HTTP client, creating it on first use.
+
+    Sharing one client keeps connections (and TLS sessions) alive across
+    sources and runs within the same process. httpx clients are safe to
+    use from multiple threads, so concurrent source fetches can share it.
+    Sources must pass per-request headers instead of mutating the client.
+
+    Returns:
+        Shared httpx.Client instance.
+    """
+    with _shared_http.lock:
+        client = _shared_http.client
+        if client is None or client.is_closed:
+            client = _shared_http.client = create_http_client()
+        return client
+
+
+@atexit.register
+def close_http_client() -> None:
+    """Close the shared HTTP client if it was created.
+
+    Registered with atexit; safe to call multiple times.
+    """
+    with _shared_http.lock:
+        if _shared_http.client is not None:
+            _shared_http.client.close()
+            _shared_http.client = None
+
+
+def load_json(data: str | bytes) -> Any:
+    """Deserialize JSON text, using orjson when installed.
+
+    Both backends raise `json.JSONDecodeError` (orjson's error subclasses
+    it) on malformed input.
+
+    Args:
+        data: JSON document as text or UTF-8 bytes.
+
+    Returns:
+        Decoded Python object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def parse_html(content: bytes, encoding: str | None = "utf-8") -> HtmlElement:
+    """Parse raw HTML bytes into an lxml element tree.
+
+    Args:
+        content: Raw response body.
+        encoding: Document encoding (e.g., httpx's `response.encoding`).
+            libxml2 assumes Latin-1 for pages without a charset declaration,
+            so the encoding resolved from the HTTP headers is passed explicitly.
+
+    Returns:
+        Root element of the parsed document.
+    """
+    parser = lxml.html.HTMLParser(encoding=encoding)
+    return lxml.html.document_fromstring(content, parser=parser)
+
+
+def iterparse_html(
+    chunks: Iterable[bytes], encoding: str | None = "utf-8"
+) -> Iterator[HtmlElement]:
+    """Incrementally parse HTML, yielding each element once it is complete.
+
+    Elements are yielded as soon as their end tag is parsed, so callers can
+    stop consuming (and parsing) once they have seen enough.
+
+    Args:
+        chunks: Raw response body, in chunks (e.g., `response.iter_bytes()`).
+        encoding: Document encoding, see `parse_html`.
+
+    Yields:
+        Completed elements in document order of their end tags.
+    """
+    parser = etree.HTMLPullParser(events=("end",), encoding=encoding)
+    parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            yield element
+    parser.close()
+    for _, element in parser.read_events():
+        yield element
+
+
+def has_class(class_name: str) -> str:
+    """Build an XPath predicate equivalent to the CSS selector `.class_name`.
+
+    Args:
+        class_name: Single CSS class name.
+
+    Returns:
+        XPath predicate expression (without brackets).
+    """
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+def select_first(xpath: etree.XPath, element: HtmlElement) -> HtmlElement | None:
+    """Evaluate a compiled XPath and return the first matching element.
+
+    Args:
+        xpath: Precompiled XPath expression.
+        element: Context element.
+
+    Returns:
+        First matching element or None.
+    """
+    result = xpath(element)
+    return result[0] if result else None
+
+
+def element_text(element: HtmlElement) -> str:
+    """Get the stripped text of an element and its descendants.
+
+    Equivalent to BeautifulSoup's `get_text(strip=True)`.
+
+    Args:
+        element: lxml element.
+
+    Returns:
+        Concatenated text with each text node stripped.
+    """
+    return "".join(text.strip() for text in element.itertext())
 
 
 def is_original_version(language: str) -> bool:
@@ -221,13 +462,34 @@ def is_original_version(language: str) -> bool:
     return True
 
 
+def parse_german_month(name: str, default: int = 0) -> int:
+    """Look up a German month name or abbreviation.
+
+    Common spellings ("Nov", "NOV", "nov", "November") hit the case-variant
+    table directly; anything else falls back to a lowercased lookup.
+
+    Args:
+        name: Month name (e.g., "Dezember", "Dez", "MÄR").
+        default: Value returned for unknown names.
+
+    Returns:
+        Month number (1-12) or the default.
+    """
+    try:
+        return GERMAN_MONTH_LOOKUP[name]
+    except KeyError:
+        return GERMAN_MONTH_MAP.get(name.lower(), default)
+
+
 def parse_german_date(date_str: str) -> datetime | None:
     """Parse various German date formats into datetime.
 
     Handles formats like:
     - "20.11.2025"
+    - "Fr, 22.11.2025" (defaults to 20:00)
     - "Fr, 22.11.2025 19:30"
     - "20.11.2025 | 20:00 Uhr"
+    - "2025-11-20" / "2025-11-20T19:30:00"
 
     Args:
         date_str: Date string in German format.
@@ -235,29 +497,28 @@ def parse_german_date(date_str: str) -> datetime | None:
     Returns:
         Parsed datetime or None if parsing fails.
     """
-    # Try ISO format first
-    for fmt in (
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%d",
-        "%d.%m.%Y",
-        "%d.%m.%Y %H:%M",
-    ):
-        try:
-            return datetime.strptime(date_str.strip(), fmt)
-        except ValueError:
-            continue
-
-    # Try German date with time (e.g., "Fr, 22.11.2025 19:30" or "20.11.2025 | 20:00")
-    match = re.search(r"(\d{1,2})\.(\d{1,2})\.(\d{4})", date_str)
+    # German date, the common case at venues (e.g., "Fr, 22.11.2025 19:30")
+    match = _GERMAN_DATE_PATTERN.search(date_str)
     if match:
         day, month, year = match.groups()
         # Try to find time
-        time_match = re.search(r"(\d{1,2}):(\d{2})", date_str)
+        time_match = _TIME_PATTERN.search(date_str)
         if time_match:
             hour, minute = time_match.groups()
             return datetime(int(year), int(month), int(day), int(hour), int(minute))
+        # A bare date means midnight, as for ISO dates; text around it 8 PM
+        if match[0] == date_str.strip():
+            return datetime(int(year), int(month), int(day))
         return datetime(int(year), int(month), int(day), 20, 0)  # Default 8 PM
 
+    # Fall back to ISO formats
+    clean_str = date_str.strip()
+    for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(clean_str, fmt)
+        except ValueError:
+            continue
+
     return None
 
 
@@ -274,11 +535,18 @@ def parse_venue_date(date_str: str) -> datetime | None:
     Returns:
         Parsed datetime or None if parsing fails.
     """
+    # Fast path: fixed-width HC format "AB22NOV2025" via slicing, no regex
+    if len(date_str) == 11 and date_str.startswith("AB"):
+        day, month = date_str[2:4], GERMAN_MONTH_LOOKUP.get(date_str[4:7])
+        year = date_str[7:]
+        if month and day.isdecimal() and year.isdecimal():
+            return datetime(int(year), month, int(day), 20, 0)  # Default 8 PM
+
     # Pattern: day + month name + year (e.g., "22NOV2025")
-    match = re.search(r"(\d{1,2})([A-ZÄÖÜa-zäöü]+)(\d{4})", date_str)
+    match = _VENUE_DATE_PATTERN.search(date_str)
     if match:
-        day, month_str, year = match.groups()
-        month = GERMAN_MONTH_MAP.get(month_str.lower(), 1)
-        return datetime(int(year), month, int(day), 20, 0)  # Default 8 PM
+        groups = match.groups()
+        month = next(i for i in range(1, 13) if groups[i] is not None)
+        return datetime(int(groups[13]), month, int(groups[0]), 20, 0)  # Default 8 PM
 
     return None
@@ -7,6 +7,7 @@ Filters out German-dubbed versions to only include original language films.
 from __future__ import annotations
 
 import logging
+import sys
 from datetime import datetime
 from typing import Any, ClassVar
 
@@ -14,8 +15,9 @@ from kinoweek.config import ASTOR_API_URL
 from kinoweek.models import Event
 from kinoweek.sources.base import (
     BaseSource,
-    create_http_client,
+    get_http_client,
     is_original_version,
+    load_json,
     register_source,
 )
 
@@ -38,12 +40,19 @@ class AstorSource(BaseSource):
         source_type: "cinema"
     """
 
+    __slots__ = ()
+
     source_name: ClassVar[str] = "Astor Grand Cinema"
     source_type: ClassVar[str] = "cinema"
 
     # Configuration
     API_URL: ClassVar[str] = ASTOR_API_URL
     BASE_TICKET_URL: ClassVar[str] = "https://hannover.premiumkino.de/film/"
+    API_HEADERS: ClassVar[dict[str, str]] = {
+        "Accept": "application/json, text/plain, */*",
+        "Content-Type": "application/json; charset=utf-8",
+        "Referer": "https://hannover.premiumkino.de/",
+    }
 
     def fetch(self) -> list[Event]:
         """Fetch OV movie showtimes from Astor API.
@@ -56,17 +65,10 @@ class AstorSource(BaseSource):
         """
         logger.info("Fetching movies from %s", self.source_name)
 
-        with create_http_client() as client:
-            client.headers.update(
-                {
-                    "Accept": "application/json, text/plain, */*",
-                    "Content-Type": "application/json; charset=utf-8",
-                    "Referer": "https://hannover.premiumkino.de/",
-                }
-            )
-            response = client.get(self.API_URL)
-            response.raise_for_status()
-            data = response.json()
+        response = get_http_client().get(self.API_URL, headers=self.API_HEADERS)
+        response.raise_for_status()
+        # Decoded from the raw bytes with orjson when installed
+        data = load_json(response.content)
 
         events = self._parse_response(data)
         logger.info("Found %d OV movie showtimes", len(events))
@@ -87,8 +89,13 @@ class AstorSource(BaseSource):
         genres_map = {g["id"]: g["name"] for g in data.get("genres", [])}
         movies_map = {m["id"]: m for m in data.get("movies", [])}
 
+        # Movie-level metadata is shared by all performances of a movie
+        metadata_cache: dict[int, dict[str, Any]] = {}
+
         for performance in data.get("performances", []):
-            event = self._parse_performance(performance, movies_map, genres_map)
+            event = self._parse_performance(
+                performance, movies_map, genres_map, metadata_cache
+            )
             if event:
                 events.append(event)
 
@@ -99,6 +106,7 @@ class AstorSource(BaseSource):
         performance: dict[str, Any],
         movies_map: dict[int, dict[str, Any]],
         genres_map: dict[int, str],
+        metadata_cache: dict[int, dict[str, Any]],
     ) -> Event | None:
         """Parse a single performance into an Event.
 
@@ -106,30 +114,37 @@ class AstorSource(BaseSource):
             performance: Performance data from API.
             movies_map: Movie ID to movie data mapping.
             genres_map: Genre ID to genre name mapping.
+            metadata_cache: Movie ID to already extracted movie metadata.
 
         Returns:
             Parsed Event or None if skipped (e.g., German dub).
         """
-        movie_id = performance.get("movieId")
-        if movie_id not in movies_map:
+        # Cheap rejections first: missing start time or German dub
+        begin_str = performance.get("begin")
+        if not begin_str:
+            return None
+
+        movie_id: Any = performance.get("movieId")
+        movie = movies_map.get(movie_id)
+        if movie is None:
             return None
 
-        movie = movies_map[movie_id]
         title = movie.get("name", "Unknown")
-        language = performance.get("language", "")
+        # A handful of language labels repeat across every performance;
+        # interning lets all events share one string object per label
+        language = sys.intern(performance.get("language") or "")
 
         # Filter for Original Version only
         if not is_original_version(language):
             logger.debug("Skipping non-OV: %s (%s)", title, language)
             return None
 
-        begin_str = performance.get("begin")
-        if not begin_str:
-            return None
-
-        # Extract metadata
-        metadata = self._extract_metadata(movie, performance, genres_map)
-        metadata["movie_id"] = movie_id
+        # Extract movie metadata once, then add per-performance fields
+        movie_metadata = metadata_cache.get(movie_id)
+        if movie_metadata is None:
+            movie_metadata = self._extract_metadata(movie, genres_map)
+            metadata_cache[movie_id] = movie_metadata
+        metadata = {**movie_metadata, "language": language, "movie_id": movie_id}
 
         # Build ticket URL with movie slug
         slug = movie.get("slug", "")
@@ -149,14 +164,12 @@ class AstorSource(BaseSource):
     def _extract_metadata(
         self,
         movie: dict[str, Any],
-        performance: dict[str, Any],
         genres_map: dict[int, str],
     ) -> dict[str, Any]:
-        """Extract rich metadata from movie and performance data.
+        """Extract rich metadata from movie data.
 
         Args:
             movie: Movie data from API.
-            performance: Performance data from API.
             genres_map: Genre ID to genre name mapping.
 
         Returns:
@@ -190,7 +203,6 @@ class AstorSource(BaseSource):
             "year": movie.get("year", 0),
             "country": movie.get("country", ""),
             "genres": genre_names,
-            "language": performance.get("language", ""),
             "poster_url": poster_url,
             "synopsis": synopsis,
             "trailer_url": trailer_url,
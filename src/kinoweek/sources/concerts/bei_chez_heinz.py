@@ -10,25 +10,80 @@ from __future__ import annotations
 import logging
 import re
 from datetime import datetime
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, ClassVar, Final
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
-if TYPE_CHECKING:
-    from bs4 import Tag
-
-from kinoweek.config import GERMAN_MONTH_MAP
 from kinoweek.models import Event
 from kinoweek.sources.base import (
     BaseSource,
-    create_http_client,
+    element_text,
+    get_http_client,
+    has_class,
+    parse_german_month,
+    parse_html,
     register_source,
+    select_first,
 )
 
+if TYPE_CHECKING:
+    from lxml.html import HtmlElement
+
 __all__ = ["BeiChezHeinzSource"]
 
 logger = logging.getLogger(__name__)
 
+# Date in text ("22. November 2025") and in event URLs ("/2025-11-22/")
+_TEXT_DATE_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"(\d{1,2})\.\s*(\w+)\s*(\d{4})"
+)
+_URL_DATE_PATTERN: Final[re.Pattern[str]] = re.compile(r"/(\d{4}-\d{2}-\d{2})")
+
+# Start and door times ("Beginn: 20.00 Uhr", "Einlass: 19:00")
+_BEGINN_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"Beginn[:\s]*(\d{1,2})[.\:](\d{2})"
+)
+_EINLASS_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"Einlass[:\s]*(\d{1,2})[.\:](\d{2})"
+)
+
+# Price hints in order of preference. Each alternative is a lookahead from
+# the start of the text, so one match() honours the preference order rather
+# than returning whichever hint appears first; exactly one group is set.
+_PRICE_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"(?=.*?Abendkasse[:\s]*([^|]+))"
+    r"|(?=.*?(\d+[,.]?\d*\s*€))"
+    r"|(?=.*?(Eintritt frei))"
+    r"|(?=.*?(Ein Hut geht rum))",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Genre in non-empty parentheses after the title; captures the first part
+# before "/" or "," directly, e.g. "(Alternative / Österreich)"
+_GENRE_PATTERN: Final[re.Pattern[str]] = re.compile(r"\((?=[^)])([^/,)]*)[^)]*\)")
+
+
+def _parse_date_from_url(href: str) -> datetime | None:
+    """Extract date from URL pattern.
+
+    URL format: /programm/2025-11-22/...
+
+    Args:
+        href: Event URL path.
+
+    Returns:
+        Parsed datetime or None.
+    """
+    match = _URL_DATE_PATTERN.search(href)
+    if not match:
+        return None
+
+    # The URL date is ISO formatted, so the C parser handles it directly
+    try:
+        return datetime.fromisoformat(f"{match[1]}T20:00")
+    except ValueError:
+        return None
+
 
 @register_source("bei_chez_heinz")
 class BeiChezHeinzSource(BaseSource):
@@ -44,6 +99,8 @@ class BeiChezHeinzSource(BaseSource):
         source_type: "concert"
     """
 
+    __slots__ = ()
+
     source_name: ClassVar[str] = "Béi Chéz Heinz"
     source_type: ClassVar[str] = "concert"
     max_events: ClassVar[int | None] = 20
@@ -56,6 +113,18 @@ class BeiChezHeinzSource(BaseSource):
     # Categories: Konzert, Party & Disco, Spiel & Spaß, Kleinkunst
     CONCERT_CATEGORY: ClassVar[str] = "Konzert"
 
+    # XPath selectors, compiled once at import. Panes without a title (h3)
+    # or outside the concert category (first h4) are filtered out in C.
+    XPATH_CONCERT_PANE: ClassVar[etree.XPath] = etree.XPath(
+        f"//div[{has_class('pane')}][.//h3]"
+        f"[contains((.//h4)[1], '{CONCERT_CATEGORY}')]"
+    )
+    XPATH_TITLE: ClassVar[etree.XPath] = etree.XPath("(.//h3)[1]")
+    XPATH_LINK: ClassVar[etree.XPath] = etree.XPath("(.//a)[1]")
+    XPATH_INFO: ClassVar[etree.XPath] = etree.XPath(
+        f"(.//div[{has_class('bch-event-info')}])[1]"
+    )
+
     def fetch(self) -> list[Event]:
         """Fetch concert events from Béi Chéz Heinz.
 
@@ -67,44 +136,27 @@ class BeiChezHeinzSource(BaseSource):
         """
         logger.info("Fetching concerts from %s", self.source_name)
 
-        with create_http_client() as client:
-            response = client.get(self.URL)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+        response = get_http_client().get(self.URL)
+        response.raise_for_status()
+        root = parse_html(response.content, response.encoding)
 
-        events = self._parse_events(soup)
+        events = self._parse_events(root)
         logger.info("Found %d events from %s", len(events), self.source_name)
         return events
 
-    def _parse_events(self, soup: BeautifulSoup) -> list[Event]:
+    def _parse_events(self, root: HtmlElement) -> list[Event]:
         """Parse all concert events from the page.
 
         Args:
-            soup: Parsed HTML document.
+            root: Parsed HTML document.
 
         Returns:
             List of parsed Event objects (concerts only).
         """
         events: list[Event] = []
 
-        # Events are in div.pane containers
-        event_panes = soup.find_all("div", class_="pane")
-
-        for pane in event_panes:
-            # Check if this pane has a title (h3)
-            title_elem = pane.find("h3")
-            if not title_elem:
-                continue
-
-            # Check category - only process concerts
-            category_elem = pane.find("h4")
-            if not category_elem:
-                continue
-
-            category_text = category_elem.get_text(strip=True)
-            if self.CONCERT_CATEGORY not in category_text:
-                continue
-
+        # Events are in div.pane containers; only concert panes are selected
+        for pane in self.XPATH_CONCERT_PANE(root):
             event = self._parse_event(pane)
             if event:
                 events.append(event)
@@ -113,28 +165,28 @@ class BeiChezHeinzSource(BaseSource):
 
         return events
 
-    def _parse_event(self, pane: Tag) -> Event | None:
+    def _parse_event(self, pane: HtmlElement) -> Event | None:
         """Parse a single event from a pane div.
 
         Args:
-            pane: BeautifulSoup Tag element (div.pane).
+            pane: lxml element (div.pane).
 
         Returns:
             Parsed Event or None if parsing fails.
         """
         try:
             # Extract title from h3
-            title_elem = pane.find("h3")
-            if not title_elem:
+            title_elem = select_first(self.XPATH_TITLE, pane)
+            if title_elem is None:
                 return None
 
             # Get title text, prefer link text if available
-            title_link = title_elem.find("a")
-            if title_link:
-                title = title_link.get_text(strip=True)
+            title_link = select_first(self.XPATH_LINK, title_elem)
+            if title_link is not None:
+                title = element_text(title_link)
                 href = title_link.get("href", "")
             else:
-                title = title_elem.get_text(strip=True)
+                title = element_text(title_elem)
                 href = ""
 
             if not title:
@@ -147,11 +199,15 @@ class BeiChezHeinzSource(BaseSource):
                 event_url = href or self.URL
 
             # Extract date from URL first (most reliable)
-            event_date = self._parse_date_from_url(href)
+            event_date = _parse_date_from_url(href)
 
             # Get info section for time and price
-            info_elem = pane.find("div", class_="bch-event-info")
-            info_text = info_elem.get_text(separator=" | ", strip=True) if info_elem else ""
+            info_elem = select_first(self.XPATH_INFO, pane)
+            info_text = (
+                " | ".join(t for t in map(str.strip, info_elem.itertext()) if t)
+                if info_elem is not None
+                else ""
+            )
 
             # Parse time from info text
             time_str = "20:00"
@@ -207,14 +263,13 @@ class BeiChezHeinzSource(BaseSource):
 
         # Parse date if not provided: "Samstag 22. November 2025" or "22. November 2025"
         if not event_date:
-            date_pattern = r"(\d{1,2})\.\s*(\w+)\s*(\d{4})"
-            date_match = re.search(date_pattern, text)
+            date_match = _TEXT_DATE_PATTERN.search(text)
             if date_match:
                 day = int(date_match.group(1))
-                month_str = date_match.group(2).lower()
+                month_str = date_match.group(2)
                 year = int(date_match.group(3))
 
-                month = GERMAN_MONTH_MAP.get(month_str, 0)
+                month = parse_german_month(month_str)
                 if month:
                     try:
                         event_date = datetime(year, month, day, 20, 0)
@@ -222,7 +277,7 @@ class BeiChezHeinzSource(BaseSource):
                         pass
 
         # Parse time: prefer "Beginn:" over "Einlass:"
-        beginn_match = re.search(r"Beginn[:\s]*(\d{1,2})[.\:](\d{2})", text)
+        beginn_match = _BEGINN_PATTERN.search(text)
         if beginn_match:
             hour, minute = beginn_match.groups()
             time_str = f"{int(hour)}:{minute}"
@@ -230,7 +285,7 @@ class BeiChezHeinzSource(BaseSource):
                 event_date = event_date.replace(hour=int(hour), minute=int(minute))
         else:
             # Fallback to Einlass time
-            einlass_match = re.search(r"Einlass[:\s]*(\d{1,2})[.\:](\d{2})", text)
+            einlass_match = _EINLASS_PATTERN.search(text)
             if einlass_match:
                 hour, minute = einlass_match.groups()
                 # Concerts typically start 1 hour after doors
@@ -241,27 +296,6 @@ class BeiChezHeinzSource(BaseSource):
 
         return event_date, time_str
 
-    def _parse_date_from_url(self, href: str) -> datetime | None:
-        """Extract date from URL pattern.
-
-        URL format: /programm/2025-11-22/...
-
-        Args:
-            href: Event URL path.
-
-        Returns:
-            Parsed datetime or None.
-        """
-        match = re.search(r"/(\d{4})-(\d{2})-(\d{2})", href)
-        if not match:
-            return None
-
-        try:
-            year, month, day = match.groups()
-            return datetime(int(year), int(month), int(day), 20, 0)
-        except (ValueError, TypeError):
-            return None
-
     def _extract_price(self, text: str) -> str:
         """Extract price information from event text.
 
@@ -272,19 +306,10 @@ class BeiChezHeinzSource(BaseSource):
             Price string or empty string.
         """
         # Look for "Abendkasse:" or price patterns
-        price_patterns = [
-            r"Abendkasse[:\s]*([^|]+)",
-            r"(\d+[,.]?\d*\s*€)",
-            r"(Eintritt frei)",
-            r"(Ein Hut geht rum)",
-        ]
-
-        for pattern in price_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-
-        return ""
+        match = _PRICE_PATTERN.match(text)
+        if match is None:
+            return ""
+        return match[match.lastindex or 0].strip()
 
     def _extract_genre(self, title: str) -> str:
         """Extract genre from title if present in parentheses.
@@ -297,10 +322,5 @@ class BeiChezHeinzSource(BaseSource):
         Returns:
             Genre string or empty string.
         """
-        match = re.search(r"\(([^)]+)\)", title)
-        if match:
-            genre_text = match.group(1)
-            # Take first part before "/" or ","
-            genre = re.split(r"[/,]", genre_text)[0].strip()
-            return genre
-        return ""
+        match = _GENRE_PATTERN.search(title)
+        return match.group(1).strip() if match else ""
@@ -10,19 +10,23 @@ import logging
 from datetime import datetime
 from typing import TYPE_CHECKING, ClassVar
 
-from bs4 import BeautifulSoup
-
-if TYPE_CHECKING:
-    from bs4 import Tag
+from lxml import etree
 
 from kinoweek.models import Event
 from kinoweek.sources.base import (
     BaseSource,
-    create_http_client,
+    element_text,
+    get_http_client,
+    has_class,
+    parse_html,
     parse_venue_date,
     register_source,
+    select_first,
 )
 
+if TYPE_CHECKING:
+    from lxml.html import HtmlElement
+
 __all__ = ["CapitolSource"]
 
 logger = logging.getLogger(__name__)
@@ -42,6 +46,8 @@ class CapitolSource(BaseSource):
         source_type: "concert"
     """
 
+    __slots__ = ()
+
     source_name: ClassVar[str] = "Capitol Hannover"
     source_type: ClassVar[str] = "concert"
     max_events: ClassVar[int | None] = 15
@@ -51,11 +57,24 @@ class CapitolSource(BaseSource):
     BASE_URL: ClassVar[str] = "https://www.capitol-hannover.de"
     ADDRESS: ClassVar[str] = "Schwarzer Bär 2, 30449 Hannover"
 
-    # CSS Selectors (HC-Kartenleger system)
-    SELECTOR_EVENT: ClassVar[str] = "a.hc-card-link-wrapper"
-    SELECTOR_TITLE: ClassVar[str] = "h4, h3"
-    SELECTOR_DATE: ClassVar[str] = "time"
-    SELECTOR_SUBTITLE: ClassVar[str] = ".hc-card-subtitle, .subtitle, p"
+    # XPath selectors (HC-Kartenleger system), compiled once at import
+    XPATH_EVENT: ClassVar[etree.XPath] = etree.XPath(
+        f"//a[{has_class('hc-card-link-wrapper')}]"
+    )
+    XPATH_TITLE: ClassVar[etree.XPath] = etree.XPath("(.//h4 | .//h3)[1]")
+    XPATH_DATE: ClassVar[etree.XPath] = etree.XPath("(.//time)[1]")
+    XPATH_SUBTITLE: ClassVar[etree.XPath] = etree.XPath(
+        f"(.//*[{has_class('hc-card-subtitle')} or {has_class('subtitle')}]"
+        " | .//p)[1]"
+    )
+    XPATH_IMAGE: ClassVar[etree.XPath] = etree.XPath("(.//img)[1]")
+    # Sold-out marker class or "ausverkauft"/"sold out" in the card text
+    # (case-folded with translate), evaluated as one boolean expression
+    XPATH_SOLD_OUT: ClassVar[etree.XPath] = etree.XPath(
+        f"boolean(.//*[{has_class('ausverkauft')} or contains(@class, 'sold')])"
+        " or contains(translate(., 'AUSVERKFTOLD', 'ausverkftold'), 'ausverkauft')"
+        " or contains(translate(., 'AUSVERKFTOLD', 'ausverkftold'), 'sold out')"
+    )
 
     def fetch(self) -> list[Event]:
         """Fetch concert events from Capitol Hannover.
@@ -68,69 +87,66 @@ class CapitolSource(BaseSource):
         """
         logger.info("Fetching concerts from %s", self.source_name)
 
-        with create_http_client() as client:
-            response = client.get(self.URL)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+        response = get_http_client().get(self.URL)
+        response.raise_for_status()
+        root = parse_html(response.content, response.encoding)
 
-        events = self._parse_events(soup)
+        events = self._parse_events(root)
         logger.info("Found %d events from %s", len(events), self.source_name)
         return events
 
-    def _parse_events(self, soup: BeautifulSoup) -> list[Event]:
+    def _parse_events(self, root: HtmlElement) -> list[Event]:
         """Parse all events from the page.
 
         Args:
-            soup: Parsed HTML document.
+            root: Parsed HTML document.
 
         Returns:
             List of parsed Event objects.
         """
-        events: list[Event] = []
-        event_items = soup.select(self.SELECTOR_EVENT)
-
+        event_items = self.XPATH_EVENT(root)
         limit = self.max_events or len(event_items)
-        for item in event_items[:limit]:
-            event = self._parse_event(item)
-            if event:
-                events.append(event)
 
-        return events
+        parse_event = self._parse_event
+        return [
+            event for item in event_items[:limit] if (event := parse_event(item))
+        ]
 
-    def _parse_event(self, item: Tag) -> Event | None:
+    def _parse_event(self, item: HtmlElement) -> Event | None:
         """Parse a single HC-style event item.
 
         Args:
-            item: BeautifulSoup Tag element representing one event.
+            item: lxml element representing one event.
 
         Returns:
             Parsed Event or None if parsing fails.
         """
         try:
+            # Parse date first - cards without a usable date are skipped
+            # before any other selector work (format: "AB22NOV2025")
+            date_elem = select_first(self.XPATH_DATE, item)
+            if date_elem is None:
+                return None
+
+            date_str = element_text(date_elem)
+            event_date = parse_venue_date(date_str)
+            if not event_date:
+                return None
+
             # Extract title from 'title' attribute or h4/h3
             title_attr = item.get("title")
             title = str(title_attr) if title_attr else None
             if not title:
-                title_elem = item.select_one(self.SELECTOR_TITLE)
-                title = title_elem.get_text(strip=True) if title_elem else None
+                title_elem = select_first(self.XPATH_TITLE, item)
+                title = element_text(title_elem) if title_elem is not None else None
             if not title:
                 return None
 
-            # Parse date from time element (format: "AB22NOV2025")
-            date_elem = item.select_one(self.SELECTOR_DATE)
-            if not date_elem:
-                return None
-
-            date_str = date_elem.get_text(strip=True)
-            event_date = parse_venue_date(date_str)
-            if not event_date:
-                return None
-
             # Extract URL
             href = item.get("href")
             event_url = str(href) if href else ""
-            if event_url and not event_url.startswith("http"):
-                event_url = f"{self.BASE_URL}{event_url}"
+            if event_url.startswith("/"):
+                event_url = self.BASE_URL + event_url
 
             # Extract optional metadata
             subtitle = self._extract_subtitle(item, title)
@@ -144,7 +160,7 @@ class CapitolSource(BaseSource):
                 url=event_url,
                 category="radar",
                 metadata={
-                    "time": event_date.strftime("%H:%M"),
+                    "time": f"{event_date.hour:02d}:{event_date.minute:02d}",
                     "subtitle": subtitle,
                     "image_url": image_url,
                     "status": status,
@@ -157,56 +173,48 @@ class CapitolSource(BaseSource):
             logger.debug("Error parsing %s event: %s", self.source_name, exc)
             return None
 
-    def _extract_subtitle(self, item: Tag, title: str) -> str:
+    def _extract_subtitle(self, item: HtmlElement, title: str) -> str:
         """Extract subtitle/description from event item.
 
         Args:
-            item: BeautifulSoup Tag element.
+            item: lxml element.
             title: Event title (to avoid duplication).
 
         Returns:
             Subtitle string or empty string.
         """
-        subtitle_elem = item.select_one(self.SELECTOR_SUBTITLE)
-        if not subtitle_elem:
+        subtitle_elem = select_first(self.XPATH_SUBTITLE, item)
+        if subtitle_elem is None:
             return ""
-        subtitle = subtitle_elem.get_text(strip=True)
+        subtitle = element_text(subtitle_elem)
         return subtitle if subtitle != title else ""
 
-    def _extract_image_url(self, item: Tag) -> str:
+    def _extract_image_url(self, item: HtmlElement) -> str:
         """Extract image URL from event item.
 
         Args:
-            item: BeautifulSoup Tag element.
+            item: lxml element.
 
         Returns:
             Image URL or empty string.
         """
-        img_elem = item.select_one("img")
-        if not img_elem:
+        img_elem = select_first(self.XPATH_IMAGE, item)
+        if img_elem is None:
             return ""
 
         src = img_elem.get("src") or img_elem.get("data-src")
         image_url = str(src) if src else ""
-        if image_url and not image_url.startswith("http"):
-            image_url = f"{self.BASE_URL}{image_url}"
+        if image_url.startswith("/"):
+            image_url = self.BASE_URL + image_url
         return image_url
 
-    def _check_sold_out_status(self, item: Tag) -> str:
+    def _check_sold_out_status(self, item: HtmlElement) -> str:
         """Check if event is sold out.
 
         Args:
-            item: BeautifulSoup Tag element.
+            item: lxml element.
 
         Returns:
             "sold_out" or "available".
         """
-        status_elem = item.select_one(".sold-out, .ausverkauft, [class*='sold']")
-        if status_elem:
-            return "sold_out"
-
-        item_text = item.get_text().lower()
-        if "ausverkauft" in item_text or "sold out" in item_text:
-            return "sold_out"
-
-        return "available"
+        return "sold_out" if self.XPATH_SOLD_OUT(item) else "available"
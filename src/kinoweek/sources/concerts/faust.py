@@ -9,24 +9,87 @@ from __future__ import annotations
 import logging
 import re
 from datetime import datetime
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, ClassVar, Final
 
-from bs4 import BeautifulSoup
-
-if TYPE_CHECKING:
-    from bs4 import Tag
+from lxml import etree
 
 from kinoweek.models import Event
 from kinoweek.sources.base import (
     BaseSource,
-    create_http_client,
+    get_http_client,
+    parse_html,
     register_source,
+    select_first,
 )
 
+if TYPE_CHECKING:
+    from lxml.html import HtmlElement
+
 __all__ = ["FaustSource"]
 
 logger = logging.getLogger(__name__)
 
+# Event detail links (/veranstaltungen/<month>/<DDMMYY>-<slug>.html)
+_EVENT_HREF_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"/veranstaltungen/\w+/\d{6}-[\w-]+\.html"
+)
+_URL_DATE_PATTERN: Final[re.Pattern[str]] = re.compile(r"/(\d{2})(\d{2})(\d{2})-")
+
+
+def _build_line_classifier(locations: tuple[str, ...]) -> re.Pattern[str]:
+    """Build one regex that classifies a line of an event block.
+
+    Branches are anchored at the start of the line and tried in priority
+    order, so a single `match()` replaces the chain of per-line checks.
+    Exactly one of the groups `date`, `hour`, `time_line`, `price` or
+    `location` is set on a match; non-matching lines are title candidates.
+
+    Args:
+        locations: Known location names within the venue.
+
+    Returns:
+        Compiled classifier pattern.
+    """
+    location_names = "|".join(map(re.escape, locations))
+    return re.compile(
+        # Date line, e.g. "Fr, 21.11.25"
+        r"(?P<date>[A-Za-z]{2},\s*\d{1,2}\.\d{1,2}\.\d{2})"
+        # Start time, e.g. "Beginn: 19:30"
+        r"|(?=.*?Beginn[:\s]*(?P<hour>\d{1,2})[:.](?P<minute>\d{2}))"
+        # Other door/start lines, optionally with "HH:MM Uhr"
+        r"|(?P<time_line>(?=.*?(?:Einlass|Beginn)))"
+        r"(?:.*?(?P<uhr_hour>\d{1,2})[:.](?P<uhr_minute>\d{2})\s*Uhr)?"
+        # Price, e.g. "VVK 25€ / AK 32€"
+        r"|(?P<price>(?=.*?(?:VVK|AK|€)))"
+        # Location within the venue
+        rf"|(?P<location>(?=.*?(?:{location_names})))"
+    )
+
+
+def _parse_date_from_url(href: str) -> datetime | None:
+    """Extract date from URL pattern.
+
+    URL format: /veranstaltungen/november/211125-le-fly.html
+    Date part: 211125 = 21.11.25 (day.month.year)
+
+    Args:
+        href: Event URL path.
+
+    Returns:
+        Parsed datetime or None.
+    """
+    # Extract date from URL: DDMMYY format
+    match = _URL_DATE_PATTERN.search(href)
+    if not match:
+        return None
+
+    day, month, year = map(int, match.groups())
+    try:
+        # Convert 2-digit year to 4-digit (25 -> 2025)
+        return datetime(2000 + year, month, day, 20, 0)
+    except ValueError:
+        return None
+
 
 @register_source("faust_hannover")
 class FaustSource(BaseSource):
@@ -42,6 +105,8 @@ class FaustSource(BaseSource):
         source_type: "concert"
     """
 
+    __slots__ = ()
+
     source_name: ClassVar[str] = "Faust"
     source_type: ClassVar[str] = "concert"
     max_events: ClassVar[int | None] = 20
@@ -54,6 +119,28 @@ class FaustSource(BaseSource):
     # Categories available: 1=Party, 2=Livemusik, 3=Ausstellung, 4=Bühne,
     # 5=Markt, 6=Gesellschaft, 7=Literatur, 8=Fest
 
+    # Known locations (stages) within Faust
+    KNOWN_LOCATIONS: ClassVar[tuple[str, ...]] = (
+        "60er-Jahre Halle",
+        "Mephisto",
+        "Warenannahme",
+        "Kunsthalle",
+        "Café",
+        "Gretchen",
+    )
+    LINE_CLASSIFIER: ClassVar[re.Pattern[str]] = _build_line_classifier(
+        KNOWN_LOCATIONS
+    )
+
+    # XPath selectors, compiled once at import
+    # Candidate event links (/veranstaltungen/ ... .html, possibly followed
+    # by a query or fragment); the strict href pattern then only runs on
+    # this narrowed set
+    XPATH_LINK: ClassVar[etree.XPath] = etree.XPath(
+        "//a[contains(@href, '/veranstaltungen/') and contains(@href, '.html')]"
+    )
+    XPATH_IMAGE: ClassVar[etree.XPath] = etree.XPath("(.//img)[1]")
+
     def fetch(self) -> list[Event]:
         """Fetch live music events from Kulturzentrum Faust.
 
@@ -65,23 +152,22 @@ class FaustSource(BaseSource):
         """
         logger.info("Fetching concerts from %s", self.source_name)
 
-        with create_http_client() as client:
-            response = client.get(self.URL)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+        response = get_http_client().get(self.URL)
+        response.raise_for_status()
+        root = parse_html(response.content, response.encoding)
 
-        events = self._parse_events(soup)
+        events = self._parse_events(root)
         logger.info("Found %d events from %s", len(events), self.source_name)
         return events
 
-    def _parse_events(self, soup: BeautifulSoup) -> list[Event]:
+    def _parse_events(self, root: HtmlElement) -> list[Event]:
         """Parse all events from the page.
 
         The page structure uses <a> tags linking to event detail pages.
         Each event block contains date, title, location, and pricing info.
 
         Args:
-            soup: Parsed HTML document.
+            root: Parsed HTML document.
 
         Returns:
             List of parsed Event objects.
@@ -89,32 +175,28 @@ class FaustSource(BaseSource):
         events: list[Event] = []
 
         # Find all event links - they point to /veranstaltungen/month/date-slug.html
-        event_links = soup.find_all(
-            "a", href=re.compile(r"/veranstaltungen/\w+/\d{6}-[\w-]+\.html")
-        )
-
-        # Deduplicate by href (same event may appear multiple times)
-        seen_urls: set[str] = set()
-        unique_links: list[Tag] = []
-        for link in event_links:
+        is_event_href = _EVENT_HREF_PATTERN.search
+
+        # Deduplicate by href, keeping the first link (dicts preserve order)
+        links_by_href: dict[str, HtmlElement] = {}
+        for link in self.XPATH_LINK(root):
             href = link.get("href", "")
-            if href and href not in seen_urls:
-                seen_urls.add(href)
-                unique_links.append(link)
+            if is_event_href(href):
+                links_by_href.setdefault(href, link)
 
-        limit = self.max_events or len(unique_links)
-        for link in unique_links[:limit]:
+        limit = self.max_events or len(links_by_href)
+        for link in list(links_by_href.values())[:limit]:
             event = self._parse_event(link)
             if event:
                 events.append(event)
 
         return events
 
-    def _parse_event(self, link: Tag) -> Event | None:
+    def _parse_event(self, link: HtmlElement) -> Event | None:
         """Parse a single event from its link element.
 
         Args:
-            link: BeautifulSoup Tag element (anchor tag with event link).
+            link: lxml element (anchor tag with event link).
 
         Returns:
             Parsed Event or None if parsing fails.
@@ -128,13 +210,13 @@ class FaustSource(BaseSource):
             event_url = href if href.startswith("http") else f"{self.BASE_URL}{href}"
 
             # Extract date from URL: /veranstaltungen/november/211125-le-fly.html
-            event_date = self._parse_date_from_url(href)
+            event_date = _parse_date_from_url(href)
             if not event_date:
                 return None
 
             # Get the text content and parse it
-            text_content = link.get_text(separator="\n", strip=True)
-            lines = [line.strip() for line in text_content.split("\n") if line.strip()]
+            text_content = "\n".join(link.itertext())
+            lines = [line for line in map(str.strip, text_content.split("\n")) if line]
 
             if not lines:
                 return None
@@ -168,31 +250,6 @@ class FaustSource(BaseSource):
             logger.debug("Error parsing %s event: %s", self.source_name, exc)
             return None
 
-    def _parse_date_from_url(self, href: str) -> datetime | None:
-        """Extract date from URL pattern.
-
-        URL format: /veranstaltungen/november/211125-le-fly.html
-        Date part: 211125 = 21.11.25 (day.month.year)
-
-        Args:
-            href: Event URL path.
-
-        Returns:
-            Parsed datetime or None.
-        """
-        # Extract date from URL: DDMMYY format
-        match = re.search(r"/(\d{2})(\d{2})(\d{2})-", href)
-        if not match:
-            return None
-
-        try:
-            day, month, year = match.groups()
-            # Convert 2-digit year to 4-digit (25 -> 2025)
-            full_year = 2000 + int(year)
-            return datetime(full_year, int(month), int(day), 20, 0)
-        except (ValueError, TypeError):
-            return None
-
     def _parse_event_content(
         self, lines: list[str]
     ) -> tuple[str, str, str, str]:
@@ -216,41 +273,20 @@ class FaustSource(BaseSource):
         time_str = "20:00"
         location = ""
         price = ""
+        classify = self.LINE_CLASSIFIER.match
 
         for line in lines:
-            # Skip date lines (e.g., "Fr, 21.11.25")
-            if re.match(r"^[A-Za-z]{2},\s*\d{1,2}\.\d{1,2}\.\d{2}", line):
-                continue
-
-            # Extract time from "Einlass: HH:MM" or "Beginn: HH:MM"
-            time_match = re.search(r"Beginn[:\s]*(\d{1,2})[:\.](\d{2})", line)
-            if time_match:
-                time_str = f"{time_match.group(1)}:{time_match.group(2)}"
-                continue
-
-            # Also check for simple time format
-            if "Einlass" in line or "Beginn" in line:
-                simple_time = re.search(r"(\d{1,2})[:\.](\d{2})\s*Uhr", line)
-                if simple_time:
-                    time_str = f"{simple_time.group(1)}:{simple_time.group(2)}"
-                continue
-
-            # Extract price (VVK/AK pattern)
-            if "VVK" in line or "AK" in line or "€" in line:
-                price = line
-                continue
-
-            # Known locations within Faust
-            known_locations = [
-                "60er-Jahre Halle",
-                "Mephisto",
-                "Warenannahme",
-                "Kunsthalle",
-                "Café",
-                "Gretchen",
-            ]
-            if any(loc in line for loc in known_locations):
-                location = line
+            match = classify(line)
+            if match is not None:
+                # Date lines (e.g., "Fr, 21.11.25") are skipped
+                if match["hour"] is not None:
+                    time_str = f"{match['hour']}:{match['minute']}"
+                elif match["uhr_hour"] is not None:
+                    time_str = f"{match['uhr_hour']}:{match['uhr_minute']}"
+                elif match["price"] is not None:
+                    price = line
+                elif match["location"] is not None:
+                    location = line
                 continue
 
             # First substantial line is likely the title
@@ -259,17 +295,17 @@ class FaustSource(BaseSource):
 
         return title, time_str, location, price
 
-    def _extract_image_url(self, link: Tag) -> str:
+    def _extract_image_url(self, link: HtmlElement) -> str:
         """Extract image URL from event link.
 
         Args:
-            link: BeautifulSoup Tag element.
+            link: lxml element.
 
         Returns:
             Image URL or empty string.
         """
-        img_elem = link.find("img")
-        if not img_elem:
+        img_elem = select_first(self.XPATH_IMAGE, link)
+        if img_elem is None:
             return ""
 
         src = img_elem.get("src") or img_elem.get("data-src")
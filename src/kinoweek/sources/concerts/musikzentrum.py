@@ -12,14 +12,13 @@ import json
 import logging
 import re
 from datetime import datetime
-from typing import ClassVar
-
-from bs4 import BeautifulSoup
+from typing import ClassVar, Final
 
 from kinoweek.models import Event
 from kinoweek.sources.base import (
     BaseSource,
-    create_http_client,
+    get_http_client,
+    load_json,
     register_source,
 )
 
@@ -27,6 +26,22 @@ __all__ = ["MusikZentrumSource"]
 
 logger = logging.getLogger(__name__)
 
+# The JSON-LD block; its payload is all this source reads from the page.
+# The type attribute may be double-, single- or unquoted.
+_JSON_LD_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"<script[^>]+type=(?P<quote>[\"']?)application/ld\+json(?P=quote)"
+    r"(?:\s[^>]*)?>(?P<payload>.*?)</script>",
+    re.DOTALL | re.IGNORECASE,
+)
+
+# Trailing UTC offset, stripped before the strptime fallback
+_TZ_OFFSET_PATTERN: Final[re.Pattern[str]] = re.compile(r"[+-]\d{2}:\d{2}$")
+
+# Cleanup for titles and descriptions: leftover numeric entities and HTML
+# tags (whitespace runs are collapsed with str.split, which is faster)
+_ENTITY_PATTERN: Final[re.Pattern[str]] = re.compile(r"\s*&#\d+;\s*")
+_HTML_TAG_PATTERN: Final[re.Pattern[str]] = re.compile(r"<[^>]+>")
+
 
 @register_source("musikzentrum")
 class MusikZentrumSource(BaseSource):
@@ -42,6 +57,8 @@ class MusikZentrumSource(BaseSource):
         source_type: "concert"
     """
 
+    __slots__ = ()
+
     source_name: ClassVar[str] = "MusikZentrum"
     source_type: ClassVar[str] = "concert"
     max_events: ClassVar[int | None] = 20
@@ -64,20 +81,21 @@ class MusikZentrumSource(BaseSource):
         """
         logger.info("Fetching concerts from %s", self.source_name)
 
-        with create_http_client() as client:
-            response = client.get(self.URL)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+        response = get_http_client().get(self.URL)
+        response.raise_for_status()
 
-        events = self._parse_events(soup)
+        events = self._parse_events(response.text)
         logger.info("Found %d events from %s", len(events), self.source_name)
         return events
 
-    def _parse_events(self, soup: BeautifulSoup) -> list[Event]:
+    def _parse_events(self, page: str) -> list[Event]:
         """Parse events from JSON-LD structured data.
 
+        The JSON-LD block is located with a regex instead of building an
+        HTML tree, since nothing else on the page is used.
+
         Args:
-            soup: Parsed HTML document.
+            page: Raw HTML of the events page.
 
         Returns:
             List of parsed Event objects.
@@ -85,13 +103,13 @@ class MusikZentrumSource(BaseSource):
         events: list[Event] = []
 
         # Find JSON-LD script
-        json_ld_script = soup.find("script", type="application/ld+json")
-        if not json_ld_script or not json_ld_script.string:
+        json_ld_match = _JSON_LD_PATTERN.search(page)
+        if not json_ld_match or not json_ld_match["payload"].strip():
             logger.warning("No JSON-LD data found on %s", self.URL)
             return events
 
         try:
-            data = json.loads(json_ld_script.string)
+            data = load_json(json_ld_match["payload"])
         except json.JSONDecodeError as exc:
             logger.warning("Failed to parse JSON-LD: %s", exc)
             return events
@@ -122,12 +140,14 @@ class MusikZentrumSource(BaseSource):
             Parsed Event or None if parsing fails.
         """
         try:
-            # Extract and decode title (may have HTML entities)
+            # Extract and decode title (may have HTML entities); most titles
+            # are plain text, so skip entity handling when there is no "&"
             title = item.get("name", "")
-            title = html.unescape(title)
-            # Clean up common patterns
-            title = re.sub(r"\s*&#\d+;\s*", " ", title)
-            title = re.sub(r"\s+", " ", title).strip()
+            if "&" in title:
+                title = html.unescape(title)
+                # Clean up common patterns
+                title = _ENTITY_PATTERN.sub(" ", title)
+            title = " ".join(title.split())
 
             if not title:
                 return None
@@ -161,7 +181,7 @@ class MusikZentrumSource(BaseSource):
                 url=event_url,
                 category="radar",
                 metadata={
-                    "time": event_date.strftime("%H:%M"),
+                    "time": f"{event_date.hour:02d}:{event_date.minute:02d}",
                     "image_url": image_url,
                     "description": description[:200] if description else "",
                     "event_type": "concert",
@@ -185,18 +205,20 @@ class MusikZentrumSource(BaseSource):
         if not date_str:
             return None
 
-        # Try various ISO formats
-        formats = [
-            "%Y-%m-%dT%H:%M:%S%z",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%d",
-        ]
+        # Fast path (C parser) for the ISO form the feed always uses; the
+        # offset is dropped so dates stay naive like every other source
+        try:
+            return datetime.fromisoformat(date_str).replace(tzinfo=None)
+        except ValueError:
+            pass
+
+        # Remove timezone for simpler parsing
+        clean_str = _TZ_OFFSET_PATTERN.sub("", date_str)
 
-        for fmt in formats:
+        # Try various ISO formats
+        for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
             try:
-                # Remove timezone for simpler parsing
-                clean_str = re.sub(r"[+-]\d{2}:\d{2}$", "", date_str)
-                return datetime.strptime(clean_str, fmt.replace("%z", ""))
+                return datetime.strptime(clean_str, fmt)
             except ValueError:
                 continue
 
@@ -234,11 +256,12 @@ class MusikZentrumSource(BaseSource):
             return ""
 
         # Decode HTML entities
-        text = html.unescape(description)
+        text = html.unescape(description) if "&" in description else description
         # Remove HTML tags
-        text = re.sub(r"<[^>]+>", " ", text)
+        if "<" in text:
+            text = _HTML_TAG_PATTERN.sub(" ", text)
         # Clean up whitespace
-        text = re.sub(r"\s+", " ", text).strip()
+        text = " ".join(text.split())
         # Remove common artifacts
         text = text.replace("[&hellip;]", "...")
 
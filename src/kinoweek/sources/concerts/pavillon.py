@@ -9,22 +9,48 @@ from __future__ import annotations
 
 import logging
 import re
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
-from typing import ClassVar
-
-from bs4 import BeautifulSoup
+from typing import TYPE_CHECKING, ClassVar, Final
 
 from kinoweek.models import Event
 from kinoweek.sources.base import (
     BaseSource,
-    create_http_client,
+    get_http_client,
+    iterparse_html,
     register_source,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from lxml.html import HtmlElement
+
 __all__ = ["PavillonSource"]
 
 logger = logging.getLogger(__name__)
 
+# Event date ("22.11.2025"), searched in card text and matched as a whole part
+_DATE_PATTERN: Final[re.Pattern[str]] = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})")
+# Start time ("18:30 Uhr")
+_TIME_PATTERN: Final[re.Pattern[str]] = re.compile(r"(\d{1,2}):(\d{2})\s*Uhr")
+
+
+@dataclass(slots=True)
+class _PendingLink:
+    """An event link whose card has not been found yet.
+
+    Attributes:
+        href: Link target.
+        text: Card text once resolved ("" if there is no dated ancestor).
+        depth: Ancestor level currently waited on (1 = parent).
+    """
+
+    href: str
+    text: str | None = None
+    depth: int = 1
+
 
 @register_source("pavillon")
 class PavillonSource(BaseSource):
@@ -40,6 +66,8 @@ class PavillonSource(BaseSource):
         source_type: "concert"
     """
 
+    __slots__ = ()
+
     source_name: ClassVar[str] = "Pavillon"
     source_type: ClassVar[str] = "concert"
     max_events: ClassVar[int | None] = 20
@@ -51,6 +79,31 @@ class PavillonSource(BaseSource):
 
     # Categories to include (music-related)
     CONCERT_CATEGORIES: ClassVar[tuple[str, ...]] = ("Konzert", "Festival", "Party")
+    CONCERT_CATEGORY_RE: ClassVar[re.Pattern[str]] = re.compile(
+        "|".join(map(re.escape, CONCERT_CATEGORIES))
+    )
+
+    # Card parts that are never the title (category labels, ticket button)
+    NON_TITLE_PARTS: ClassVar[frozenset[str]] = frozenset(
+        {"Konzert", "Festival", "Party", "Lesung", "Comedy", "Börse", "Tickets"}
+    )
+
+    # Markers of cancelled/postponed events, matched case-insensitively
+    SKIP_PATTERNS: ClassVar[tuple[str, ...]] = (
+        "Entfällt",
+        "Wird Verschoben",
+        "Abgesagt",
+        "Cancelled",
+    )
+    SKIP_PATTERN_RE: ClassVar[re.Pattern[str]] = re.compile(
+        "|".join(map(re.escape, SKIP_PATTERNS)), re.IGNORECASE
+    )
+
+    # Event cards are picked out of the parse stream: a detail link's card is
+    # the nearest of its first CARD_MAX_DEPTH ancestors whose text has a date
+    EVENT_HREF: ClassVar[str] = "/event/details/"
+    CARD_MAX_DEPTH: ClassVar[int] = 6
+    CHUNK_SIZE: ClassVar[int] = 16_384
 
     def fetch(self) -> list[Event]:
         """Fetch concert events from Pavillon Hannover.
@@ -63,41 +116,34 @@ class PavillonSource(BaseSource):
         """
         logger.info("Fetching concerts from %s", self.source_name)
 
-        with create_http_client() as client:
-            response = client.get(self.URL)
+        # Parse while downloading; leaving the block early (after max_events)
+        # closes the response without reading the rest of the program.
+        with get_http_client().stream("GET", self.URL) as response:
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            events = self._parse_events(
+                response.iter_bytes(self.CHUNK_SIZE), response.encoding
+            )
 
-        events = self._parse_events(soup)
         logger.info("Found %d events from %s", len(events), self.source_name)
         return events
 
-    def _parse_events(self, soup: BeautifulSoup) -> list[Event]:
-        """Parse concert events from the program page.
+    def _parse_events(
+        self, chunks: Iterable[bytes], encoding: str | None = "utf-8"
+    ) -> list[Event]:
+        """Parse concert events from the program page while it is parsed.
+
+        Parsing stops once `max_events` concerts have been collected.
 
         Args:
-            soup: Parsed HTML document.
+            chunks: Raw HTML body, in chunks.
+            encoding: Document encoding.
 
         Returns:
             List of parsed Event objects (concerts only).
         """
         events: list[Event] = []
-        seen_urls: set[str] = set()
-
-        # Find all event detail links
-        event_links = soup.select('a[href*="/event/details/"]')
-
-        for link in event_links:
-            href = link.get("href", "")
-            if not href or href in seen_urls:
-                continue
-            seen_urls.add(href)
-
-            # Get parent container with event info
-            event_text = self._get_event_text(link)
-            if not event_text:
-                continue
 
+        for href, event_text in self._iter_event_texts(chunks, encoding):
             # Check if this is a concert
             if not self._is_concert(event_text):
                 continue
@@ -114,26 +160,79 @@ class PavillonSource(BaseSource):
 
         return events
 
-    def _get_event_text(self, link) -> str:
+    def _iter_event_texts(
+        self, chunks: Iterable[bytes], encoding: str | None
+    ) -> Iterator[tuple[str, str]]:
+        """Stream (href, card text) pairs for unique event links.
+
+        A card's text is only complete once its end tag is parsed, so each
+        link waits on its closest unchecked ancestor. When that ancestor
+        ends, its text is checked for a date: either it is the card, or the
+        link moves on to the next ancestor. Pairs are yielded in link order
+        as soon as every earlier link is resolved; links without a dated
+        ancestor are skipped.
+
+        Links are deduplicated by normalized href (no query string or
+        trailing slash, lowercased), so an image link and a title link to the
+        same event yield one pair, while distinct events sharing a dated
+        container each yield its text.
+
+        Args:
+            chunks: Raw HTML body, in chunks.
+            encoding: Document encoding.
+
+        Yields:
+            Tuples of (href, event text).
+        """
+        seen_urls: set[str] = set()
+        pending: deque[_PendingLink] = deque()
+        # Unresolved links, keyed by the ancestor whose end tag they wait for
+        waiting: dict[HtmlElement, list[_PendingLink]] = {}
+
+        for element in iterparse_html(chunks, encoding):
+            href = element.get("href", "") if element.tag == "a" else ""
+            if self.EVENT_HREF in href:
+                url_key = href.split("?", 1)[0].rstrip("/").lower()
+                if url_key not in seen_urls:
+                    seen_urls.add(url_key)
+                    link = _PendingLink(href)
+                    pending.append(link)
+                    parent = element.getparent()
+                    if parent is None:
+                        link.text = ""
+                    else:
+                        waiting.setdefault(parent, []).append(link)
+
+            links = waiting.pop(element, None)
+            if links:
+                text = self._get_event_text(element)
+                is_card = _DATE_PATTERN.search(text) is not None
+                parent = element.getparent()
+                for link in links:
+                    if is_card:
+                        link.text = text
+                    elif parent is None or link.depth >= self.CARD_MAX_DEPTH:
+                        link.text = ""
+                    else:
+                        link.depth += 1
+                        waiting.setdefault(parent, []).append(link)
+
+            while pending and pending[0].text is not None:
+                link = pending.popleft()
+                if link.text:
+                    yield link.href, link.text
+
+    @staticmethod
+    def _get_event_text(element: HtmlElement) -> str:
         """Get the full text content of an event's container.
 
         Args:
-            link: BeautifulSoup anchor element.
+            element: Candidate container element.
 
         Returns:
-            Event text content or empty string.
+            Text of each non-empty text node, joined with " | ".
         """
-        # Walk up to find container with date info
-        parent = link.parent
-        for _ in range(6):
-            if not parent:
-                break
-            text = parent.get_text(separator=" | ", strip=True)
-            # Check if this contains event info (date pattern)
-            if re.search(r"\d{1,2}\.\d{1,2}\.\d{4}", text):
-                return text
-            parent = parent.parent
-        return ""
+        return " | ".join(text for text in map(str.strip, element.itertext()) if text)
 
     def _is_concert(self, text: str) -> bool:
         """Check if event is a concert.
@@ -144,7 +243,7 @@ class PavillonSource(BaseSource):
         Returns:
             True if event is music-related.
         """
-        return any(cat in text for cat in self.CONCERT_CATEGORIES)
+        return self.CONCERT_CATEGORY_RE.search(text) is not None
 
     def _is_cancelled(self, text: str) -> bool:
         """Check if event is cancelled or postponed.
@@ -155,13 +254,7 @@ class PavillonSource(BaseSource):
         Returns:
             True if event should be skipped.
         """
-        skip_patterns = [
-            "Entfällt",
-            "Wird Verschoben",
-            "Abgesagt",
-            "Cancelled",
-        ]
-        return any(pattern.lower() in text.lower() for pattern in skip_patterns)
+        return self.SKIP_PATTERN_RE.search(text) is not None
 
     def _parse_event(self, href: str, text: str) -> Event | None:
         """Parse event details from URL and text content.
@@ -224,7 +317,7 @@ class PavillonSource(BaseSource):
         time_str = "20:00"
 
         # Extract date: DD.MM.YYYY
-        date_match = re.search(r"(\d{1,2})\.(\d{1,2})\.(\d{4})", text)
+        date_match = _DATE_PATTERN.search(text)
         if date_match:
             day, month, year = date_match.groups()
             try:
@@ -233,7 +326,7 @@ class PavillonSource(BaseSource):
                 pass
 
         # Extract time: HH:MM Uhr
-        time_match = re.search(r"(\d{1,2}):(\d{2})\s*Uhr", text)
+        time_match = _TIME_PATTERN.search(text)
         if time_match:
             hour, minute = time_match.groups()
             time_str = f"{int(hour)}:{minute}"
@@ -265,12 +358,12 @@ class PavillonSource(BaseSource):
             if "Uhr" in part:
                 found_time = True
                 continue
-            if found_time and part and part != "Tickets":
-                # Skip category names
-                if part in ("Konzert", "Festival", "Party", "Lesung", "Comedy", "Börse"):
+            if found_time and part:
+                # Skip category names and the ticket link
+                if part in self.NON_TITLE_PARTS:
                     continue
                 # Skip dates and short items
-                if re.match(r"^\d{1,2}\.\d{1,2}\.\d{4}$", part):
+                if _DATE_PATTERN.fullmatch(part):
                     continue
                 if len(part) < 3:
                     continue
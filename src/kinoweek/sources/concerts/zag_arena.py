@@ -9,26 +9,39 @@ from __future__ import annotations
 import logging
 import re
 from datetime import datetime
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, ClassVar, Final
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
-from kinoweek.config import GERMAN_MONTH_MAP
-
-if TYPE_CHECKING:
-    from bs4 import Tag
 from kinoweek.models import Event
 from kinoweek.sources.base import (
     BaseSource,
-    create_http_client,
+    element_text,
+    get_http_client,
+    has_class,
+    iterparse_html,
     parse_german_date,
+    parse_german_month,
     register_source,
+    select_first,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from lxml.html import HtmlElement
+
 __all__ = ["ZAGArenaSource"]
 
 logger = logging.getLogger(__name__)
 
+# Start time within the date-time text ("Sa, 22.11.2025 | 19:30 Uhr")
+_TIME_PATTERN: Final[re.Pattern[str]] = re.compile(r"(\d{1,2}):(\d{2})")
+
+# Event type hints in the event URL, matched without lowercasing a copy
+_SPORT_PATTERN: Final[re.Pattern[str]] = re.compile(r"sport", re.IGNORECASE)
+_SHOW_PATTERN: Final[re.Pattern[str]] = re.compile(r"show|comedy", re.IGNORECASE)
+
 
 @register_source("zag_arena")
 class ZAGArenaSource(BaseSource):
@@ -44,6 +57,8 @@ class ZAGArenaSource(BaseSource):
         source_type: "concert"
     """
 
+    __slots__ = ()
+
     source_name: ClassVar[str] = "ZAG Arena"
     source_type: ClassVar[str] = "concert"
     max_events: ClassVar[int | None] = 15
@@ -53,13 +68,27 @@ class ZAGArenaSource(BaseSource):
     BASE_URL: ClassVar[str] = "https://www.zag-arena-hannover.de"
     ADDRESS: ClassVar[str] = "Expo Plaza 7, 30539 Hannover"
 
-    # CSS Selectors (WordPress Event Manager)
-    SELECTOR_EVENT: ClassVar[str] = ".wpem-event-layout-wrapper"
-    SELECTOR_TITLE: ClassVar[str] = ".wpem-heading-text"
-    SELECTOR_DATE_TIME: ClassVar[str] = ".wpem-event-date-time-text"
-    SELECTOR_DATE: ClassVar[str] = ".wpem-date"
-    SELECTOR_MONTH: ClassVar[str] = ".wpem-month"
-    SELECTOR_LINK: ClassVar[str] = "a.wpem-event-action-url"
+    # Event blocks are picked out of the parse stream by class
+    EVENT_CLASS: ClassVar[str] = "wpem-event-layout-wrapper"
+    CHUNK_SIZE: ClassVar[int] = 16_384
+
+    # XPath selectors (WordPress Event Manager), compiled once at import
+    XPATH_TITLE: ClassVar[etree.XPath] = etree.XPath(
+        f"(.//*[{has_class('wpem-heading-text')}])[1]"
+    )
+    XPATH_DATE_TIME: ClassVar[etree.XPath] = etree.XPath(
+        f"(.//*[{has_class('wpem-event-date-time-text')}])[1]"
+    )
+    XPATH_DATE: ClassVar[etree.XPath] = etree.XPath(
+        f"(.//*[{has_class('wpem-date')}])[1]"
+    )
+    XPATH_MONTH: ClassVar[etree.XPath] = etree.XPath(
+        f"(.//*[{has_class('wpem-month')}])[1]"
+    )
+    XPATH_LINK: ClassVar[etree.XPath] = etree.XPath(
+        f"(.//a[{has_class('wpem-event-action-url')}])[1]"
+    )
+    XPATH_IMAGE: ClassVar[etree.XPath] = etree.XPath("(.//img)[1]")
 
     def fetch(self) -> list[Event]:
         """Fetch concert events from ZAG Arena.
@@ -72,66 +101,87 @@ class ZAGArenaSource(BaseSource):
         """
         logger.info("Fetching concerts from %s", self.source_name)
 
-        with create_http_client() as client:
-            response = client.get(self.URL)
+        # Parse while downloading; leaving the block early (after max_events)
+        # closes the response without reading the rest of the page.
+        with get_http_client().stream("GET", self.URL) as response:
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            events = self._parse_events(
+                response.iter_bytes(self.CHUNK_SIZE), response.encoding
+            )
 
-        events = self._parse_events(soup)
         logger.info("Found %d events from %s", len(events), self.source_name)
         return events
 
-    def _parse_events(self, soup: BeautifulSoup) -> list[Event]:
-        """Parse all events from the page.
+    def _parse_events(
+        self, chunks: Iterable[bytes], encoding: str | None = "utf-8"
+    ) -> list[Event]:
+        """Parse events from the page while it is being parsed.
+
+        Each event block is handled as soon as its end tag is seen, and
+        parsing stops after `max_events` blocks instead of building the DOM
+        for the whole listing.
 
         Args:
-            soup: Parsed HTML document.
+            chunks: Raw HTML body, in chunks.
+            encoding: Document encoding.
 
         Returns:
             List of parsed Event objects.
         """
         events: list[Event] = []
-        event_items = soup.select(self.SELECTOR_EVENT)
+        append_event = events.append
+        parse_event = self._parse_event
+        seen = 0
+        today = datetime.now()
 
-        limit = self.max_events or len(event_items)
-        for item in event_items[:limit]:
-            event = self._parse_event(item)
+        for item in iterparse_html(chunks, encoding):
+            if self.EVENT_CLASS not in (item.get("class") or "").split():
+                continue
+
+            event = parse_event(item, today)
             if event:
-                events.append(event)
+                append_event(event)
+            item.clear(keep_tail=True)
+
+            seen += 1
+            if self.max_events and seen >= self.max_events:
+                break
 
         return events
 
-    def _parse_event(self, item: Tag) -> Event | None:
+    def _parse_event(self, item: HtmlElement, today: datetime) -> Event | None:
         """Parse a single event item.
 
         Args:
-            item: BeautifulSoup Tag element representing one event.
+            item: lxml element representing one event.
+            today: Reference date for resolving dates without a year.
 
         Returns:
             Parsed Event or None if parsing fails.
         """
         try:
             # Extract title
-            title_elem = item.select_one(self.SELECTOR_TITLE)
-            if not title_elem:
+            title_elem = select_first(self.XPATH_TITLE, item)
+            if title_elem is None:
+                return None
+            title = element_text(title_elem)
+
+            # Extract URL (a single lookup, so rejected before date parsing)
+            link_elem = select_first(self.XPATH_LINK, item)
+            if link_elem is None:
                 return None
-            title = title_elem.get_text(strip=True)
 
             # Parse date from date-time element
-            event_date, time_str = self._parse_date(item)
+            event_date, time_str = self._parse_date(item, today)
             if not event_date:
                 return None
 
-            # Extract URL
-            link_elem = item.select_one(self.SELECTOR_LINK)
-            if not link_elem:
-                return None
             href = link_elem.get("href")
             event_url = str(href) if href else ""
             if event_url and not event_url.startswith("http"):
                 event_url = f"{self.BASE_URL}{event_url}"
 
-            # Extract image URL if available
+            # Extract image URL only once the event is known to be valid
             image_url = self._extract_image_url(item)
 
             # Determine event type from URL
@@ -155,11 +205,14 @@ class ZAGArenaSource(BaseSource):
             logger.debug("Error parsing %s event: %s", self.source_name, exc)
             return None
 
-    def _parse_date(self, item: Tag) -> tuple[datetime | None, str]:
+    def _parse_date(
+        self, item: HtmlElement, today: datetime
+    ) -> tuple[datetime | None, str]:
         """Parse date and time from event item.
 
         Args:
-            item: BeautifulSoup Tag element.
+            item: lxml element.
+            today: Reference date for resolving dates without a year.
 
         Returns:
             Tuple of (datetime, time_string).
@@ -167,28 +220,29 @@ class ZAGArenaSource(BaseSource):
         event_date = None
         time_str = "20:00"
 
-        # Try date-time text element first
-        date_time_elem = item.select_one(self.SELECTOR_DATE_TIME)
-        if date_time_elem:
-            date_text = date_time_elem.get_text(strip=True)
+        # Try date-time text element first; its text is extracted once and
+        # reused for both the date and the time
+        date_time_elem = select_first(self.XPATH_DATE_TIME, item)
+        if date_time_elem is not None:
+            date_text = element_text(date_time_elem)
             event_date = parse_german_date(date_text)
             # Extract time if available
-            time_match = re.search(r"(\d{1,2}):(\d{2})", date_text)
+            time_match = _TIME_PATTERN.search(date_text)
             if time_match:
-                time_str = f"{time_match.group(1)}:{time_match.group(2)}"
+                time_str = f"{time_match[1]}:{time_match[2]}"
 
         if not event_date:
             # Fallback to day/month elements
-            day_elem = item.select_one(self.SELECTOR_DATE)
-            month_elem = item.select_one(self.SELECTOR_MONTH)
-            if day_elem and month_elem:
+            day_elem = select_first(self.XPATH_DATE, item)
+            month_elem = select_first(self.XPATH_MONTH, item)
+            if day_elem is not None and month_elem is not None:
                 try:
-                    day = int(day_elem.get_text(strip=True))
-                    month_str = month_elem.get_text(strip=True).rstrip(".")
-                    month = GERMAN_MONTH_MAP.get(month_str.lower(), 1)
+                    day = int(element_text(day_elem))
+                    month_str = element_text(month_elem).rstrip(".")
+                    month = parse_german_month(month_str, 1)
                     # Use next year if month is before current month
-                    year = datetime.now().year
-                    if month < datetime.now().month:
+                    year = today.year
+                    if month < today.month:
                         year += 1
                     event_date = datetime(year, month, day, 20, 0)
                 except (ValueError, TypeError):
@@ -196,17 +250,17 @@ class ZAGArenaSource(BaseSource):
 
         return event_date, time_str
 
-    def _extract_image_url(self, item: Tag) -> str:
+    def _extract_image_url(self, item: HtmlElement) -> str:
         """Extract image URL from event item.
 
         Args:
-            item: BeautifulSoup Tag element.
+            item: lxml element.
 
         Returns:
             Image URL or empty string.
         """
-        img_elem = item.select_one("img")
-        if not img_elem:
+        img_elem = select_first(self.XPATH_IMAGE, item)
+        if img_elem is None:
             return ""
 
         src = img_elem.get("src") or img_elem.get("data-src")
@@ -225,9 +279,8 @@ class ZAGArenaSource(BaseSource):
         Returns:
             Event type string.
         """
-        url_lower = url.lower()
-        if "sport" in url_lower:
+        if _SPORT_PATTERN.search(url):
             return "sport"
-        if "show" in url_lower or "comedy" in url_lower:
+        if _SHOW_PATTERN.search(url):
             return "show"
         return "concert"
@@ -0,0 +1,72 @@
+"""Shared pytest fixtures for the KinoWeek test suite."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import httpx
+import pytest
+
+from kinoweek.sources import base
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from kinoweek.notifier import EventsData
+
+
+class MockRoutes:
+    """Canned HTTP responses keyed by URL, served through httpx.MockTransport.
+
+    Unknown URLs get a 404, so a test that forgets a route fails loudly
+    instead of reaching the network.
+    """
+
+    def __init__(self) -> None:
+        self.routes: dict[str, tuple[int, dict[str, Any]]] = {}
+        self.requests: list[httpx.Request] = []
+
+    def add_response(self, url: str, status_code: int = 200, **kwargs: Any) -> None:
+        """Serve a response for `url` (kwargs as for `httpx.Response`)."""
+        self.routes[url] = (status_code, kwargs)
+
+    def reset(self) -> None:
+        """Forget all routes and recorded requests."""
+        self.routes.clear()
+        self.requests.clear()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        status_code, kwargs = self.routes.get(str(request.url), (404, {}))
+        return httpx.Response(status_code, **kwargs)
+
+
+@pytest.fixture(scope="session")
+def _mock_http() -> Iterator[tuple[MockRoutes, httpx.Client]]:
+    """Build one routing table and mock-transport client for the session."""
+    routes = MockRoutes()
+    with httpx.Client(
+        transport=httpx.MockTransport(routes), follow_redirects=True
+    ) as client:
+        yield routes, client
+
+
+@pytest.fixture
+def http_mock(
+    _mock_http: tuple[MockRoutes, httpx.Client], monkeypatch: pytest.MonkeyPatch
+) -> MockRoutes:
+    """Install the mock-transport client as the shared HTTP client.
+
+    Sources fetch through `get_http_client()`, so they are served from
+    the returned routes for the duration of one test.
+    """
+    routes, client = _mock_http
+    routes.reset()
+    monkeypatch.setattr(base._shared_http, "client", client)
+    return routes
+
+
+@pytest.fixture
+def empty_data() -> EventsData:
+    """Categorized events for a week with nothing on."""
+    return {"movies_this_week": [], "big_events_radar": []}
@@ -9,17 +9,119 @@ Tests cover the core modules:
 
 from __future__ import annotations
 
+import json
+import threading
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
 
+import httpx
 import pytest
 
 from kinoweek.aggregator import fetch_all_events
+from kinoweek.config import HTTP_CACHE_DIR_ENV
+from kinoweek.main import run
 from kinoweek.models import Event
-from kinoweek.notifier import format_message, notify, send_telegram_message
+from kinoweek.notifier import (
+    format_message,
+    format_message_chunks,
+    notify,
+    send_telegram_message,
+    split_message,
+)
+from kinoweek.output import group_movies_by_film
+from kinoweek.sources.base import (
+    close_http_client,
+    create_http_client,
+    get_http_client,
+    parse_german_date,
+    parse_german_month,
+    parse_html,
+    parse_venue_date,
+)
 from kinoweek.sources.cinema.astor import AstorSource as AstorMovieScraper
+from kinoweek.sources.concerts.bei_chez_heinz import BeiChezHeinzSource
+from kinoweek.sources.concerts.faust import FaustSource
+from kinoweek.sources.concerts.musikzentrum import MusikZentrumSource
+from kinoweek.sources.concerts.pavillon import PavillonSource
+from kinoweek.sources.concerts.swiss_life_hall import SwissLifeHallSource
 from kinoweek.sources.concerts.zag_arena import ZAGArenaSource as ConcertVenueScraper
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from conftest import MockRoutes
+
+    from kinoweek.notifier import EventsData
+
+
+# =============================================================================
+# Test Data
+# =============================================================================
+
+# Fixed showtime for tests that only need some valid date
+_FIXED_DT = datetime(2024, 11, 24, 19, 30)
+
+# Astor API payloads, built once at import and shared by the tests that
+# serve them (httpx serializes them per request, so they are never mutated)
+_ASTOR_EMPTY_PAYLOAD = {"genres": [], "movies": [], "performances": []}
+
+_ASTOR_MOVIE_PAYLOAD = {
+    "genres": [{"id": 1, "name": "Drama"}],
+    "movies": [
+        {
+            "id": 100,
+            "name": "Test Movie",
+            "minutes": 120,
+            "rating": 12,
+            "year": 2024,
+            "country": "US",
+            "genreIds": [1],
+        }
+    ],
+    "performances": [
+        {
+            "movieId": 100,
+            "begin": "2024-11-24T19:30:00",
+            "language": "Sprache: Englisch",
+        }
+    ],
+}
+
+_ASTOR_DUBBED_PAYLOAD = {
+    "genres": [],
+    "movies": [{"id": 100, "name": "Test Movie"}],
+    "performances": [
+        {
+            "movieId": 100,
+            "begin": "2024-11-24T19:30:00",
+            "language": "Sprache: Deutsch",  # German dub, should be filtered
+        }
+    ],
+}
+
+# One valid showtime plus one whose language is null in the API response
+_ASTOR_NULL_LANGUAGE_PAYLOAD = {
+    "genres": [],
+    "movies": [{"id": 100, "name": "Test Movie"}],
+    "performances": [
+        {"movieId": 100, "begin": "2024-11-24T17:00:00", "language": None},
+        {
+            "movieId": 100,
+            "begin": "2024-11-24T19:30:00",
+            "language": "Sprache: Englisch",
+        },
+    ],
+}
+
+
+def _telegram_response(
+    payload: dict[str, object] | None = None, status_code: int = 200
+) -> httpx.Response:
+    """Build a real Bot API response (raise_for_status needs its request)."""
+    request = httpx.Request("POST", "https://api.telegram.org/bot/sendMessage")
+    return httpx.Response(status_code, json=payload, request=request)
+
 
 # =============================================================================
 # Event Model Tests
@@ -33,7 +135,7 @@ class TestEventModel:
         """Test basic event creation with required fields."""
         event = Event(
             title="Test Movie",
-            date=datetime.now(),
+            date=_FIXED_DT,
             venue="Test Venue",
             url="https://example.com",
             category="movie",
@@ -42,13 +144,15 @@ class TestEventModel:
         assert event.venue == "Test Venue"
         assert event.category == "movie"
         assert event.metadata == {}
+        # Slotted: no per-instance __dict__
+        assert not hasattr(event, "__dict__")
 
     def test_event_with_metadata(self) -> None:
         """Test event creation with metadata."""
         metadata = {"duration": 120, "rating": 12}
         event = Event(
             title="Test Movie",
-            date=datetime.now(),
+            date=_FIXED_DT,
             venue="Test Venue",
             url="https://example.com",
             category="movie",
@@ -61,7 +165,7 @@ class TestEventModel:
         """Test short date formatting."""
         event = Event(
             title="Test",
-            date=datetime(2024, 11, 24, 19, 30),
+            date=_FIXED_DT,
             venue="Venue",
             url="https://example.com",
             category="movie",
@@ -74,7 +178,7 @@ class TestEventModel:
         """Test time formatting."""
         event = Event(
             title="Test",
-            date=datetime(2024, 11, 24, 19, 30),
+            date=_FIXED_DT,
             venue="Venue",
             url="https://example.com",
             category="movie",
@@ -111,7 +215,7 @@ class TestEventModel:
         for category in ("movie", "culture", "radar"):
             event = Event(
                 title="Test",
-                date=datetime.now(),
+                date=_FIXED_DT,
                 venue="Venue",
                 url="https://example.com",
                 category=category,
@@ -119,6 +223,52 @@ class TestEventModel:
             assert event.category == category
 
 
+# =============================================================================
+# Date Parsing Tests
+# =============================================================================
+
+
+class TestParseVenueDate:
+    """Tests for venue date parsing helpers."""
+
+    def test_parses_german_date_with_time(self) -> None:
+        """Test German dates with and without a clock time."""
+        assert parse_german_date("Fr, 22.11.2025 19:30") == datetime(
+            2025, 11, 22, 19, 30
+        )
+        assert parse_german_date("20.11.2025") == datetime(2025, 11, 20)
+        assert parse_german_date("Do, 20.11.2025") == datetime(2025, 11, 20, 20, 0)
+
+    def test_parses_german_month(self) -> None:
+        """Test month lookup across case variants, with a default."""
+        assert parse_german_month("Dez") == 12
+        assert parse_german_month("MÄRZ") == 3
+        assert parse_german_month("sEpTeMbEr") == 9
+        assert parse_german_month("Brumaire") == 0
+        assert parse_german_month("Brumaire", 1) == 1
+
+    def test_parses_iso_date(self) -> None:
+        """Test the ISO fallback of the German date parser."""
+        assert parse_german_date("2025-11-20T19:30:00") == datetime(
+            2025, 11, 20, 19, 30
+        )
+        assert parse_german_date("2025-11-20") == datetime(2025, 11, 20)
+        assert parse_german_date("no date here") is None
+
+    def test_parses_hc_format(self) -> None:
+        """Test parsing of the compact HC-Kartenleger date format."""
+        assert parse_venue_date("AB22NOV2025") == datetime(2025, 11, 22, 20, 0)
+
+    def test_parses_german_month_names(self) -> None:
+        """Test parsing of full and umlauted German month names."""
+        assert parse_venue_date("1März2026") == datetime(2026, 3, 1, 20, 0)
+        assert parse_venue_date("05dez2025") == datetime(2025, 12, 5, 20, 0)
+
+    def test_unknown_month_returns_none(self) -> None:
+        """Test that unknown month names are rejected."""
+        assert parse_venue_date("3Foo2025") is None
+
+
 # =============================================================================
 # Scraper Tests
 # =============================================================================
@@ -127,91 +277,60 @@ class TestEventModel:
 class TestAstorMovieScraper:
     """Tests for the Astor movie scraper."""
 
-    def test_scraper_source_name(self) -> None:
+    @pytest.fixture(scope="class")
+    def astor(self) -> AstorMovieScraper:
+        """One scraper for the class; sources keep no per-fetch state."""
+        return AstorMovieScraper()
+
+    def test_scraper_source_name(self, astor: AstorMovieScraper) -> None:
         """Test scraper returns correct source name."""
-        scraper = AstorMovieScraper()
-        assert scraper.source_name == "Astor Grand Cinema"
+        assert astor.source_name == "Astor Grand Cinema"
 
-    @patch("kinoweek.sources.base.httpx.Client")
-    def test_fetch_returns_list(self, mock_client: Mock) -> None:
+    def test_fetch_returns_list(
+        self, astor: AstorMovieScraper, http_mock: MockRoutes
+    ) -> None:
         """Test that fetch returns a list of events."""
-        # Mock API response
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "genres": [],
-            "movies": [],
-            "performances": [],
-        }
-        mock_client.return_value.__enter__.return_value.get.return_value = (
-            mock_response
-        )
+        http_mock.add_response(AstorMovieScraper.API_URL, json=_ASTOR_EMPTY_PAYLOAD)
 
-        scraper = AstorMovieScraper()
-        result = scraper.fetch()
+        result = astor.fetch()
 
         assert isinstance(result, list)
 
-    @patch("kinoweek.sources.base.httpx.Client")
-    def test_fetch_parses_movies(self, mock_client: Mock) -> None:
+    def test_fetch_parses_movies(
+        self, astor: AstorMovieScraper, http_mock: MockRoutes
+    ) -> None:
         """Test that fetch correctly parses movie data."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "genres": [{"id": 1, "name": "Drama"}],
-            "movies": [
-                {
-                    "id": 100,
-                    "name": "Test Movie",
-                    "minutes": 120,
-                    "rating": 12,
-                    "year": 2024,
-                    "country": "US",
-                    "genreIds": [1],
-                }
-            ],
-            "performances": [
-                {
-                    "movieId": 100,
-                    "begin": "2024-11-24T19:30:00",
-                    "language": "Sprache: Englisch",
-                }
-            ],
-        }
-        mock_client.return_value.__enter__.return_value.get.return_value = (
-            mock_response
-        )
+        http_mock.add_response(AstorMovieScraper.API_URL, json=_ASTOR_MOVIE_PAYLOAD)
 
-        scraper = AstorMovieScraper()
-        result = scraper.fetch()
+        result = astor.fetch()
 
         assert len(result) == 1
         assert result[0].title == "Test Movie"
         assert result[0].category == "movie"
         assert result[0].metadata["duration"] == 120
 
-    @patch("kinoweek.sources.base.httpx.Client")
-    def test_fetch_filters_german_dubs(self, mock_client: Mock) -> None:
+    def test_fetch_filters_german_dubs(
+        self, astor: AstorMovieScraper, http_mock: MockRoutes
+    ) -> None:
         """Test that German dubbed movies are filtered out."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "genres": [],
-            "movies": [{"id": 100, "name": "Test Movie"}],
-            "performances": [
-                {
-                    "movieId": 100,
-                    "begin": "2024-11-24T19:30:00",
-                    "language": "Sprache: Deutsch",  # German dub, should be filtered
-                }
-            ],
-        }
-        mock_client.return_value.__enter__.return_value.get.return_value = (
-            mock_response
-        )
+        http_mock.add_response(AstorMovieScraper.API_URL, json=_ASTOR_DUBBED_PAYLOAD)
 
-        scraper = AstorMovieScraper()
-        result = scraper.fetch()
+        result = astor.fetch()
 
         assert len(result) == 0
 
+    def test_fetch_skips_null_language(
+        self, astor: AstorMovieScraper, http_mock: MockRoutes
+    ) -> None:
+        """Test a performance without a language is skipped, not fatal."""
+        http_mock.add_response(
+            AstorMovieScraper.API_URL, json=_ASTOR_NULL_LANGUAGE_PAYLOAD
+        )
+
+        result = astor.fetch()
+
+        assert [e.date for e in result] == [_FIXED_DT]
+
 
 class TestConcertVenueScraper:
     """Tests for the concert venue scraper (ZAG Arena)."""
@@ -226,11 +345,322 @@ class TestConcertVenueScraper:
         scraper = ConcertVenueScraper()
         assert scraper.max_events == 15
 
+    def test_parse_events(self) -> None:
+        """Test parsing of WPEM event blocks, including the day/month fallback."""
+        page = b"""
+        <div class="wpem-event-layout-wrapper">
+          <div class="wpem-heading-text">LUCIANO</div>
+          <div class="wpem-event-date-time-text">29.11.2025 - 19:30</div>
+          <a class="wpem-event-action-url" href="/event/luciano">Tickets</a>
+          <img data-src="/luciano.jpg">
+        </div>
+        <div class="wpem-event-layout-wrapper">
+          <div class="wpem-heading-text">Handball</div>
+          <span class="wpem-date">5</span><span class="wpem-month">Dez.</span>
+          <a class="wpem-event-action-url" href="https://zag.de/sport/handball">x</a>
+        </div>
+        """
+
+        events = ConcertVenueScraper()._parse_events([page])
+
+        assert [e.title for e in events] == ["LUCIANO", "Handball"]
+        assert events[0].date == datetime(2025, 11, 29, 19, 30)
+        assert events[0].url == "https://www.zag-arena-hannover.de/event/luciano"
+        assert events[0].metadata["time"] == "19:30"
+        assert events[0].metadata["image_url"].endswith("/luciano.jpg")
+        assert events[1].date.month == 12
+        assert events[1].metadata["event_type"] == "sport"
+
+    def test_parse_events_stops_at_max_events(self) -> None:
+        """Test parsing stops once max_events blocks have been seen."""
+        block = (
+            '<div class="wpem-event-layout-wrapper">'
+            '<div class="wpem-heading-text">Show {i}</div>'
+            '<div class="wpem-event-date-time-text">29.11.2025 - 19:30</div>'
+            '<a class="wpem-event-action-url" href="/event/{i}">Tickets</a>'
+            "</div>"
+        )
+        chunks = [block.format(i=i).encode() for i in range(40)]
+
+        events = ConcertVenueScraper()._parse_events(iter(chunks))
+
+        assert len(events) == 15
+        assert events[-1].title == "Show 14"
+
+
+class TestHCVenueScraper:
+    """Tests for the HC-Kartenleger venue scrapers (Swiss Life Hall, Capitol)."""
+
+    def test_parse_events(self) -> None:
+        """Test parsing of HC cards with title, subtitle and sold-out status."""
+        page = """
+        <a class="hc-card-link-wrapper" href="/events/band">
+          <time>AB22NOV2025</time><h3>Band</h3><p>Tour 2025</p>
+          <img src="/band.jpg">
+        </a>
+        <a class="hc-card-link-wrapper" href="https://x.de/e/2" title="Other">
+          <time>AB1MÄR2026</time><div>Ausverkauft</div>
+        </a>
+        <a class="hc-card-link-wrapper" href="/events/nodate"><h3>No date</h3></a>
+        """.encode()
+
+        events = SwissLifeHallSource()._parse_events(parse_html(page))
+
+        assert [e.title for e in events] == ["Band", "Other"]
+        assert events[0].date == datetime(2025, 11, 22, 20, 0)
+        assert events[0].url == "https://www.swisslife-hall.de/events/band"
+        assert events[0].metadata["subtitle"] == "Tour 2025"
+        assert events[0].metadata["status"] == "available"
+        assert events[1].url == "https://x.de/e/2"
+        assert events[1].metadata["status"] == "sold_out"
+
+
+class TestBeiChezHeinzScraper:
+    """Tests for the Béi Chéz Heinz scraper."""
+
+    def test_parse_events_keeps_concert_panes(self) -> None:
+        """Test that only concert panes with a title are parsed."""
+        page = """
+        <div class="pane">
+          <h3><a href="programm/2025-11-22/1">FREUDE (Alternative / Österreich)</a></h3>
+          <h4>_Konzert_</h4>
+          <div class="bch-event-info"><p>Einlass: 19.00 Uhr</p><p>Abendkasse: 12 €</p></div>
+        </div>
+        <div class="pane"><h3>Disco</h3><h4>Party &amp; Disco</h4></div>
+        <div class="pane"><h4>Konzert</h4></div>
+        """.encode()
+
+        events = BeiChezHeinzSource()._parse_events(parse_html(page))
+
+        assert len(events) == 1
+        event = events[0]
+        assert event.title == "FREUDE (Alternative / Österreich)"
+        assert event.url == "https://www.beichezheinz.de/programm/2025-11-22/1"
+        assert event.date == datetime(2025, 11, 22, 20, 0)
+        assert event.metadata["price"] == "12 €"
+        assert event.metadata["genre"] == "Alternative"
+
+
+class TestFaustScraper:
+    """Tests for the Kulturzentrum Faust scraper."""
+
+    def test_parse_events_dedupes_event_links(self) -> None:
+        """Test event links are parsed once and other links are ignored."""
+        page = """
+        <a href="/veranstaltungen/november/211125-le-fly.html">
+          <img src="/media/le-fly.jpg">
+          <span>Fr, 21.11.25</span><h2>Le Fly</h2>
+          <p>Mephisto</p><p>VVK 25€ / AK 32€</p>
+          <p>Einlass: 18:30 Uhr / Beginn: 19:30 Uhr</p>
+        </a>
+        <a href="/veranstaltungen/november/211125-le-fly.html">Le Fly</a>
+        <a href="/kontakt.html">Kontakt</a>
+        """.encode()
+
+        events = FaustSource()._parse_events(parse_html(page))
+
+        assert len(events) == 1
+        event = events[0]
+        assert event.title == "Le Fly"
+        assert event.date == datetime(2025, 11, 21, 20, 0)
+        assert event.url.endswith("/veranstaltungen/november/211125-le-fly.html")
+        assert event.metadata["time"] == "19:30"
+        assert event.metadata["location"] == "Mephisto"
+        assert event.metadata["price"] == "VVK 25€ / AK 32€"
+        assert event.metadata["image_url"] == (
+            "https://www.kulturzentrum-faust.de/media/le-fly.jpg"
+        )
+
+    def test_parse_events_accepts_query_string_hrefs(self) -> None:
+        """Test event links with a query string or fragment are kept."""
+        page = b"""
+        <a href="/veranstaltungen/november/211125-le-fly.html?rub=2">
+          <span>Fr, 21.11.25</span><h2>Le Fly</h2>
+        </a>
+        <a href="/veranstaltungen/november/221125-kettcar.html#tickets">
+          <span>Sa, 22.11.25</span><h2>Kettcar</h2>
+        </a>
+        """
+
+        events = FaustSource()._parse_events(parse_html(page))
+
+        assert [e.title for e in events] == ["Le Fly", "Kettcar"]
+        assert events[0].url.endswith("211125-le-fly.html?rub=2")
+
+
+class TestMusikZentrumScraper:
+    """Tests for the MusikZentrum scraper."""
+
+    def test_fetch_parses_json_ld(self, http_mock: MockRoutes) -> None:
+        """Test events are read from the page's JSON-LD block."""
+        payload = (
+            '[{"@type": "Event", "name": "Motörhead Tribute",'
+            ' "startDate": "2025-11-22T20:00:00+01:00",'
+            ' "url": "https://musikzentrum-hannover.de/e/1"}]'
+        )
+        page = (
+            '<html><head><script type="application/ld+json">'
+            f"{payload}</script></head><body></body></html>"
+        )
+        http_mock.add_response(MusikZentrumSource.URL, text=page)
+
+        events = MusikZentrumSource().fetch()
+
+        assert len(events) == 1
+        assert events[0].title == "Motörhead Tribute"
+        assert events[0].date == datetime(2025, 11, 22, 20, 0)
+        assert events[0].metadata["time"] == "20:00"
+
+    def test_fetch_decodes_declared_charset(self, http_mock: MockRoutes) -> None:
+        """Test the body is decoded with the charset from Content-Type."""
+        page = (
+            '<script type="application/ld+json">[{"@type": "Event",'
+            ' "name": "Motörhead Tribute", "startDate": "2025-11-22T20:00:00"}]'
+            "</script>"
+        )
+        http_mock.add_response(
+            MusikZentrumSource.URL,
+            content=page.encode("iso-8859-1"),
+            headers={"Content-Type": "text/html; charset=iso-8859-1"},
+        )
+
+        events = MusikZentrumSource().fetch()
+
+        assert [event.title for event in events] == ["Motörhead Tribute"]
+
+    def test_parse_events_accepts_unquoted_script_type(self) -> None:
+        """Test a JSON-LD block with an unquoted type attribute is found."""
+        page = (
+            "<script id=ld type=application/ld+json>"
+            '[{"@type": "Event", "name": "Tinariwen",'
+            ' "startDate": "2025-11-22T20:00:00"}]</script>'
+        )
+
+        events = MusikZentrumSource()._parse_events(page)
+
+        assert [event.title for event in events] == ["Tinariwen"]
+
+    def test_malformed_json_ld_yields_no_events(self) -> None:
+        """Test a broken JSON-LD block is logged and skipped, not raised."""
+        page = '<script type="application/ld+json">[{"@type": "Event",</script>'
+
+        assert MusikZentrumSource()._parse_events(page) == []
+
+
+class TestPavillonScraper:
+    """Tests for the Pavillon scraper."""
+
+    def test_parse_events_reads_dated_card(self) -> None:
+        """Test each card is parsed once from its nearest dated ancestor."""
+        page = """
+        <div class="card">
+          <a href="/event/details/1-tinariwen"><img src="/tinariwen.jpg"></a>
+          <div><span>Sa</span><span>22.11.2025</span><span>18:30 Uhr</span></div>
+          <h3><a href="/Event/Details/1-Tinariwen/">Tinariwen</a></h3>
+          <span>Konzert</span><a href="/event/details/1-tinariwen?ref=t">Tickets</a>
+        </div>
+        <div class="card">
+          <p>So | 23.11.2025 | 20:00 Uhr</p>
+          <a href="/event/details/2">Lesung mit Gästen</a><span>Lesung</span>
+        </div>
+        <div class="card">
+          <p>Mo | 24.11.2025 | 19:00 Uhr</p>
+          <a href="/event/details/3">Abgesagt: Band</a><span>Konzert</span>
+        </div>
+        """.encode()
+
+        events = PavillonSource()._parse_events([page])
+
+        assert len(events) == 1
+        event = events[0]
+        assert event.title == "Tinariwen"
+        assert event.date == datetime(2025, 11, 22, 18, 30)
+        assert event.url == "https://pavillon-hannover.de/event/details/1-tinariwen"
+        assert event.metadata["time"] == "18:30"
+        assert event.metadata["genre"] == "Konzert"
+
+    def test_parse_events_keeps_events_sharing_a_card(self) -> None:
+        """Test distinct event links under one dated container are all kept."""
+        page = b"""
+        <section>
+          <h2>Sa | 22.11.2025 | 18:30 Uhr</h2>
+          <div><a href="/event/details/1-support">Support Act</a></div>
+          <div><a href="/event/details/2-headliner">Headliner</a></div>
+          <span>Konzert</span>
+        </section>
+        """
+
+        events = PavillonSource()._parse_events([page])
+
+        assert [event.url for event in events] == [
+            "https://pavillon-hannover.de/event/details/1-support",
+            "https://pavillon-hannover.de/event/details/2-headliner",
+        ]
+        assert all(event.date == datetime(2025, 11, 22, 18, 30) for event in events)
+
+    def test_parse_events_stops_reading_at_max_events(self, monkeypatch) -> None:
+        """Test parsing stops consuming chunks once max_events are found."""
+        card = (
+            '<div><p>Sa | 22.11.2025 | 20:00 Uhr</p>'
+            '<a href="/event/details/{0}">Band {0}</a><span>Konzert</span></div>'
+        )
+        consumed: list[int] = []
+
+        def chunks() -> Iterator[bytes]:
+            yield b"<html><body>"
+            for number in range(1, 6):
+                consumed.append(number)
+                yield card.format(number).encode()
+            yield b"</body></html>"
+
+        monkeypatch.setattr(PavillonSource, "max_events", 2)
+
+        events = PavillonSource()._parse_events(chunks())
+
+        assert [event.title for event in events] == ["Band 1", "Band 2"]
+        assert consumed[-1] < 5
+
+
+class TestHttpClient:
+    """Tests for the shared HTTP client factory."""
+
+    def test_cache_dir_enables_caching_client(self, tmp_path, monkeypatch) -> None:
+        """Test the on-disk cache is used only when the env var is set."""
+        hishel_httpx = pytest.importorskip("hishel.httpx")
+
+        monkeypatch.delenv(HTTP_CACHE_DIR_ENV, raising=False)
+        with create_http_client() as client:
+            assert not isinstance(client, hishel_httpx.SyncCacheClient)
+
+        monkeypatch.setenv(HTTP_CACHE_DIR_ENV, str(tmp_path / "cache"))
+        with create_http_client() as client:
+            assert isinstance(client, hishel_httpx.SyncCacheClient)
+        assert (tmp_path / "cache").is_dir()
+
+    def test_shared_client_is_reused_until_closed(self) -> None:
+        """Test sources share one pooled client that is rebuilt after close."""
+        close_http_client()
+        try:
+            client = get_http_client()
+            assert get_http_client() is client
+
+            close_http_client()
+            assert client.is_closed
+            assert get_http_client() is not client
+        finally:
+            close_http_client()
+
 
 class TestFetchAllEvents:
     """Tests for the event aggregation function."""
 
-    @patch("kinoweek.aggregator.get_all_sources")
+    @pytest.fixture
+    def mock_get_sources(self, monkeypatch) -> Mock:
+        """Replace the source registry lookup for one test."""
+        get_sources = Mock()
+        monkeypatch.setattr("kinoweek.aggregator.get_all_sources", get_sources)
+        return get_sources
+
     def test_returns_categorized_dict(
         self,
         mock_get_sources: Mock,
@@ -238,7 +668,7 @@ class TestFetchAllEvents:
         """Test that fetch_all_events returns correctly structured data."""
         # Mock the source registry to return empty sources
         mock_source = Mock()
-        mock_source.return_value.enabled = True
+        mock_source.enabled = True
         mock_source.return_value.fetch.return_value = []
         mock_get_sources.return_value = {"mock_source": mock_source}
 
@@ -249,6 +679,123 @@ class TestFetchAllEvents:
         assert isinstance(result["movies_this_week"], list)
         assert isinstance(result["big_events_radar"], list)
 
+    def test_failing_source_does_not_block_others(
+        self,
+        mock_get_sources: Mock,
+    ) -> None:
+        """Test that one failing source doesn't drop events from the rest."""
+        concert = Event(
+            title="Rock Concert",
+            date=datetime.now() + timedelta(days=30),
+            venue="ZAG Arena",
+            url="https://example.com",
+            category="radar",
+        )
+        failing_source = Mock()
+        failing_source.enabled = True
+        failing_source.return_value.fetch.side_effect = RuntimeError("boom")
+        working_source = Mock()
+        working_source.enabled = True
+        working_source.return_value.fetch.return_value = [concert]
+        mock_get_sources.return_value = {
+            "failing": failing_source,
+            "working": working_source,
+        }
+
+        result = fetch_all_events()
+
+        assert result["big_events_radar"] == [concert]
+
+    def test_disabled_source_is_not_fetched(
+        self,
+        mock_get_sources: Mock,
+    ) -> None:
+        """Test that a source with enabled = False is never instantiated."""
+        disabled_source = Mock()
+        disabled_source.enabled = False
+        enabled_source = Mock()
+        enabled_source.enabled = True
+        enabled_source.return_value.fetch.return_value = []
+        mock_get_sources.return_value = {
+            "disabled": disabled_source,
+            "enabled": enabled_source,
+        }
+
+        fetch_all_events()
+
+        disabled_source.assert_not_called()
+        disabled_source.return_value.fetch.assert_not_called()
+        enabled_source.return_value.fetch.assert_called_once_with()
+
+    def test_sources_are_fetched_concurrently(
+        self,
+        mock_get_sources: Mock,
+    ) -> None:
+        """Test that sources are fetched in parallel, not one after another."""
+        # Both fetches must be in flight at once for the barrier to release
+        barrier = threading.Barrier(2, timeout=5)
+
+        def make_source(title: str) -> Mock:
+            event = Event(
+                title=title,
+                date=datetime.now() + timedelta(days=30),
+                venue="Venue",
+                url="https://example.com",
+                category="radar",
+            )
+            source = Mock()
+            source.enabled = True
+            source.return_value.fetch.side_effect = lambda: (barrier.wait(), [event])[1]
+            return source
+
+        mock_get_sources.return_value = {
+            "first": make_source("First"),
+            "second": make_source("Second"),
+        }
+
+        result = fetch_all_events()
+
+        assert {e.title for e in result["big_events_radar"]} == {"First", "Second"}
+
+    def test_events_are_windowed_and_sorted(
+        self,
+        mock_get_sources: Mock,
+    ) -> None:
+        """Test that each bucket keeps only its date window, in order."""
+        now = datetime.now()
+
+        def make_event(title: str, days: float, category: str) -> Event:
+            return Event(
+                title=title,
+                date=now + timedelta(days=days),
+                venue="Venue",
+                url="https://example.com",
+                category=category,
+            )
+
+        source = Mock()
+        source.return_value.fetch.return_value = [
+            make_event("Later Movie", 5, "movie"),
+            make_event("Past Movie", -1, "movie"),
+            make_event("Soon Movie", 1, "movie"),
+            make_event("Next Month Movie", 30, "movie"),
+            make_event("Far Concert", 60, "radar"),
+            make_event("This Week Concert", 3, "radar"),
+            make_event("Near Concert", 10, "radar"),
+        ]
+        mock_get_sources.return_value = {"mixed": source}
+
+        result = fetch_all_events()
+
+        assert [e.title for e in result["movies_this_week"]] == [
+            "Soon Movie",
+            "Later Movie",
+        ]
+        assert [e.title for e in result["big_events_radar"]] == [
+            "Near Concert",
+            "Far Concert",
+        ]
+
 
 # =============================================================================
 # Notifier Tests
@@ -258,38 +805,61 @@ class TestFetchAllEvents:
 class TestFormatMessage:
     """Tests for message formatting."""
 
-    def test_format_message_returns_string(self) -> None:
+    @pytest.fixture(scope="class")
+    def many_movies(self) -> list[Event]:
+        """A week with more movies than fit in one Telegram message."""
+        return [
+            Event(
+                title=f"Movie {i}" * 10,
+                date=_FIXED_DT,
+                venue="Astor",
+                url="https://example.com",
+                category="movie",
+                metadata={"duration": 120},
+            )
+            for i in range(100)
+        ]
+
+    @pytest.fixture(scope="class")
+    def inception(self) -> Event:
+        """A single OV movie showtime."""
+        return Event(
+            title="Inception",
+            date=_FIXED_DT,
+            venue="Astor Grand Cinema",
+            url="https://example.com",
+            category="movie",
+            metadata={"duration": 148, "year": 2010, "language": "Sprache: Englisch"},
+        )
+
+    @pytest.fixture(scope="class")
+    def rock_concert(self) -> Event:
+        """A single radar concert."""
+        return Event(
+            title="Rock Concert",
+            date=datetime(2024, 12, 15, 20, 0),
+            venue="ZAG Arena",
+            url="https://example.com",
+            category="radar",
+            metadata={"time": "20:00"},
+        )
+
+    def test_format_message_returns_string(self, empty_data: EventsData) -> None:
         """Test that format_message returns a string."""
-        test_data = {
-            "movies_this_week": [],
-            "big_events_radar": [],
-        }
-        result = format_message(test_data)
+        result = format_message(empty_data)
         assert isinstance(result, str)
 
-    def test_format_message_includes_sections(self) -> None:
+    def test_format_message_includes_sections(self, empty_data: EventsData) -> None:
         """Test that formatted message includes all sections."""
-        test_data = {
-            "movies_this_week": [],
-            "big_events_radar": [],
-        }
-        result = format_message(test_data)
+        result = format_message(empty_data)
 
         assert "Movies" in result
         assert "Radar" in result
 
-    def test_format_message_with_movies(self) -> None:
+    def test_format_message_with_movies(self, inception: Event) -> None:
         """Test formatting with movie events."""
-        movie = Event(
-            title="Inception",
-            date=datetime(2024, 11, 24, 19, 30),
-            venue="Astor Grand Cinema",
-            url="https://example.com",
-            category="movie",
-            metadata={"duration": 148, "year": 2010, "language": "Sprache: Englisch"},
-        )
         test_data = {
-            "movies_this_week": [movie],
+            "movies_this_week": [inception],
             "big_events_radar": [],
         }
         result = format_message(test_data)
@@ -298,19 +868,11 @@ class TestFormatMessage:
         assert "2010" in result
         assert "19:30" in result
 
-    def test_format_message_with_concerts(self) -> None:
+    def test_format_message_with_concerts(self, rock_concert: Event) -> None:
         """Test formatting with concert events."""
-        concert = Event(
-            title="Rock Concert",
-            date=datetime(2024, 12, 15, 20, 0),
-            venue="ZAG Arena",
-            url="https://example.com",
-            category="radar",
-            metadata={"time": "20:00"},
-        )
         test_data = {
             "movies_this_week": [],
-            "big_events_radar": [concert],
+            "big_events_radar": [rock_concert],
         }
         result = format_message(test_data)
 
@@ -318,96 +880,126 @@ class TestFormatMessage:
         assert "ZAG Arena" in result
         assert "20:00" in result
 
-    def test_format_message_handles_empty_data(self) -> None:
+    def test_format_message_handles_empty_data(self, empty_data: EventsData) -> None:
         """Test that empty data is handled gracefully."""
-        test_data = {
-            "movies_this_week": [],
-            "big_events_radar": [],
-        }
-        result = format_message(test_data)
+        result = format_message(empty_data)
 
         assert isinstance(result, str)
         assert "No OV movies" in result
 
-    def test_format_message_respects_telegram_limits(self) -> None:
+    def test_format_message_respects_telegram_limits(
+        self, many_movies: list[Event]
+    ) -> None:
         """Test that formatted message doesn't exceed Telegram limits."""
-        # Create many events to potentially exceed limit
-        movies = [
-            Event(
-                title=f"Movie {i}" * 10,
-                date=datetime(2024, 11, 24, 19, 30),
-                venue="Astor",
-                url="https://example.com",
-                category="movie",
-                metadata={"duration": 120},
-            )
-            for i in range(100)
-        ]
         test_data = {
-            "movies_this_week": movies,
+            "movies_this_week": many_movies,
             "big_events_radar": [],
         }
         result = format_message(test_data)
 
         assert len(result) <= 4096
+        assert result.endswith("\n\n... (truncated)")
+
+    def test_format_message_chunks_splits_instead_of_truncating(
+        self, many_movies: list[Event]
+    ) -> None:
+        """Test that long weeks are split into several complete messages."""
+        test_data = {
+            "movies_this_week": many_movies,
+            "big_events_radar": [],
+        }
+        chunks = format_message_chunks(test_data)
+
+        assert len(chunks) > 1
+        assert all(0 < len(chunk) <= 4096 for chunk in chunks)
+        assert "truncated" not in "".join(chunks)
+        assert "Movie 99" in chunks[-1]
+        assert "On The Radar" in chunks[-1]
+
+    def test_split_message_cuts_at_lines(self) -> None:
+        """Test that chunks end on line boundaries unless a line is too long."""
+        assert split_message("short", max_length=10) == ["short"]
+        assert split_message("aaaa\nbbbb\ncccc", max_length=10) == [
+            "aaaa\nbbbb",
+            "cccc",
+        ]
+        assert split_message("x" * 25, max_length=10) == ["x" * 10, "x" * 10, "x" * 5]
 
 
 class TestSendTelegram:
     """Tests for Telegram notification functionality."""
 
-    @patch("kinoweek.notifier.httpx.Client")
-    @patch.dict(
-        "os.environ",
-        {"TELEGRAM_BOT_TOKEN": "test_token", "TELEGRAM_CHAT_ID": "test_chat"},
+    @pytest.fixture
+    def mock_client(self, monkeypatch) -> Mock:
+        """Replace the shared HTTP client with a spec'd mock for one test."""
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "test_token")
+        monkeypatch.setenv("TELEGRAM_CHAT_ID", "test_chat")
+        client = Mock(spec=httpx.Client)
+        monkeypatch.setattr("kinoweek.notifier.get_http_client", lambda: client)
+        return client
+
+    @pytest.mark.parametrize(
+        ("post_result", "expected"),
+        [
+            ({"ok": True}, True),
+            ({"ok": False, "error": "Bad request"}, False),
+            (httpx.RequestError("Network error"), False),
+        ],
+        ids=["ok", "api-error", "network-error"],
     )
-    def test_send_telegram_makes_api_call(self, mock_client: Mock) -> None:
-        """Test that send_telegram_message makes correct API call."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"ok": True}
-        mock_client.return_value.__enter__.return_value.post.return_value = (
-            mock_response
-        )
+    def test_send_telegram_posts_message(
+        self, mock_client: Mock, post_result: object, expected: bool
+    ) -> None:
+        """Test the API call and how its outcome maps to the return value."""
+        if isinstance(post_result, Exception):
+            mock_client.post.side_effect = post_result
+        else:
+            mock_client.post.return_value = _telegram_response(post_result)
 
         result = send_telegram_message("Test message")
 
-        mock_client.return_value.__enter__.return_value.post.assert_called_once()
-        assert result is True
+        mock_client.post.assert_called_once()
+        body = json.loads(mock_client.post.call_args.kwargs["content"])
+        assert body == {
+            "chat_id": "test_chat",
+            "text": "Test message",
+            "parse_mode": "Markdown",
+        }
+        assert result is expected
 
-    @patch("kinoweek.notifier.httpx.Client")
-    @patch.dict(
-        "os.environ",
-        {"TELEGRAM_BOT_TOKEN": "test_token", "TELEGRAM_CHAT_ID": "test_chat"},
-    )
-    def test_send_telegram_handles_api_error(self, mock_client: Mock) -> None:
-        """Test that API errors are handled properly."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"ok": False, "error": "Bad request"}
-        mock_client.return_value.__enter__.return_value.post.return_value = (
-            mock_response
-        )
+    def test_send_telegram_retries_transient_errors(
+        self, mock_client: Mock, monkeypatch
+    ) -> None:
+        """Test that connection errors and 5xx responses are retried."""
+        mock_sleep = Mock()
+        monkeypatch.setattr("kinoweek.notifier.time.sleep", mock_sleep)
+
+        mock_client.post.side_effect = [
+            httpx.ConnectError("Connection reset"),
+            _telegram_response(status_code=502),
+            _telegram_response({"ok": True}),
+        ]
 
         result = send_telegram_message("Test message")
-        assert result is False
 
-    @patch("kinoweek.notifier.httpx.Client")
-    @patch.dict(
-        "os.environ",
-        {"TELEGRAM_BOT_TOKEN": "test_token", "TELEGRAM_CHAT_ID": "test_chat"},
-    )
-    def test_send_telegram_handles_network_error(self, mock_client: Mock) -> None:
-        """Test that network errors are handled properly."""
-        import httpx
+        assert result is True
+        assert mock_client.post.call_count == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
 
-        mock_client.return_value.__enter__.return_value.post.side_effect = (
-            httpx.RequestError("Network error")
-        )
+    def test_send_telegram_uses_injected_client(self, mock_client: Mock) -> None:
+        """Test that an explicitly passed client replaces the shared one."""
+        client = Mock(spec=httpx.Client)
+        client.post.return_value = _telegram_response({"ok": True})
 
-        result = send_telegram_message("Test message")
-        assert result is False
+        assert send_telegram_message("Test message", client=client) is True
+        client.post.assert_called_once()
+        mock_client.post.assert_not_called()
 
-    @patch.dict("os.environ", {}, clear=True)
-    def test_send_telegram_requires_env_vars(self) -> None:
+    def test_send_telegram_requires_env_vars(self, monkeypatch) -> None:
         """Test that environment variables are required."""
+        monkeypatch.delenv("TELEGRAM_BOT_TOKEN", raising=False)
+        monkeypatch.delenv("TELEGRAM_CHAT_ID", raising=False)
+
         with pytest.raises(ValueError, match="TELEGRAM_BOT_TOKEN"):
             send_telegram_message("test")
 
@@ -415,36 +1007,73 @@ class TestSendTelegram:
 class TestNotify:
     """Tests for the main notify function."""
 
-    @patch("kinoweek.notifier.save_to_file")
-    def test_notify_local_mode(self, mock_save: Mock, capsys) -> None:
-        """Test notify in local mode saves to file."""
-        test_data = {
-            "movies_this_week": [],
-            "big_events_radar": [],
-        }
+    @pytest.fixture(autouse=True)
+    def _isolated_cwd(self, tmp_path, monkeypatch) -> None:
+        """Run in a temp dir: notify exports to output/ and backup/ in the cwd."""
+        monkeypatch.chdir(tmp_path)
+
+    @pytest.mark.parametrize(
+        ("local_only", "expect_send"),
+        [(True, False), (False, True)],
+        ids=["local", "production"],
+    )
+    def test_notify_saves_and_sends(
+        self,
+        empty_data: EventsData,
+        monkeypatch,
+        capsys,
+        local_only: bool,
+        expect_send: bool,
+    ) -> None:
+        """Test local mode only saves, production sends and saves a backup."""
+        mock_save = Mock()
+        mock_send = Mock(return_value=True)
+        monkeypatch.setattr("kinoweek.notifier.save_to_file", mock_save)
+        monkeypatch.setattr("kinoweek.notifier.send_telegram_message", mock_send)
 
-        result = notify(test_data, local_only=True)
+        result = notify(empty_data, local_only=local_only)
 
         assert result is True
         mock_save.assert_called_once()
+        assert mock_send.call_count == int(expect_send)
 
-    @patch("kinoweek.notifier.send_telegram_message")
-    @patch("kinoweek.notifier.save_to_file")
-    def test_notify_production_mode(
-        self, mock_save: Mock, mock_send: Mock
-    ) -> None:
-        """Test notify in production mode sends to Telegram."""
-        mock_send.return_value = True
-        test_data = {
-            "movies_this_week": [],
-            "big_events_radar": [],
-        }
 
-        result = notify(test_data, local_only=False)
+# =============================================================================
+# Output Tests
+# =============================================================================
 
-        assert result is True
-        mock_send.assert_called_once()
-        mock_save.assert_called_once()  # Backup is created
+
+class TestGroupMoviesByFilm:
+    """Tests for grouping showtimes into films."""
+
+    def test_showtimes_are_grouped_per_film(self) -> None:
+        """Test that showtimes of one film share a single grouped entry."""
+
+        def make_showtime(title: str, day: int, language: str) -> Event:
+            return Event(
+                title=title,
+                date=datetime(2024, 11, day, 19, 30),
+                venue="Astor",
+                url="https://example.com",
+                category="movie",
+                metadata={"year": 2024, "duration": 120, "language": language},
+            )
+
+        grouped = group_movies_by_film(
+            [
+                make_showtime("Wicked", 24, "Sprache: Englisch"),
+                make_showtime("Anora", 24, "Sprache: Englisch"),
+                make_showtime("Wicked", 25, "Sprache: Englisch, Untertitel: Deutsch"),
+            ]
+        )
+
+        assert [m.title for m in grouped] == ["Wicked", "Anora"]
+        wicked = grouped[0]
+        assert wicked.duration_min == 120
+        assert [(s.date, s.language, s.has_subtitles) for s in wicked.showtimes] == [
+            ("2024-11-24", "EN", False),
+            ("2024-11-25", "EN, UT:DE", True),
+        ]
 
 
 # =============================================================================
@@ -455,23 +1084,14 @@ class TestNotify:
 class TestIntegration:
     """Integration tests for the complete workflow."""
 
-    @patch.dict(
-        "os.environ",
-        {"TELEGRAM_BOT_TOKEN": "test_token", "TELEGRAM_CHAT_ID": "test_chat"},
-    )
-    @patch("kinoweek.main.notify")
-    @patch("kinoweek.main.fetch_all_events")
-    def test_full_workflow(
-        self, mock_fetch: Mock, mock_notify: Mock
-    ) -> None:
+    def test_full_workflow(self, empty_data: EventsData, monkeypatch) -> None:
         """Test the complete scraping and notification workflow."""
-        from kinoweek.main import run
-
-        mock_fetch.return_value = {
-            "movies_this_week": [],
-            "big_events_radar": [],
-        }
-        mock_notify.return_value = True
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "test_token")
+        monkeypatch.setenv("TELEGRAM_CHAT_ID", "test_chat")
+        mock_fetch = Mock(return_value=empty_data)
+        mock_notify = Mock(return_value=True)
+        monkeypatch.setattr("kinoweek.main.fetch_all_events", mock_fetch)
+        monkeypatch.setattr("kinoweek.main.notify", mock_notify)
 
         result = run(local_only=False)
 